@@ -0,0 +1,207 @@
+"""
+Benchmark: StKittsNevisCrimeFeedAggregator against recorded fixtures.
+
+Replays source pages from a local FixtureServer (recorded fixtures, or
+deterministic synthetic pages when none exist) and measures per-source
+fetch latency, parse time, classification throughput and end-to-end
+/api/live-feed-data latency under simulated source delays and failures.
+Nothing touches the live news sites.
+
+Usage:
+    python benchmarks/aggregator_benchmark.py [--fixtures DIR] [--repeat 15] [--output results.json]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import argparse
+import platform
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fixture_server import FixtureServer, DEFAULT_FIXTURES  # noqa: E402
+
+SOURCE_TIMEOUT = 1.0
+FETCH_DEADLINE = 1.5
+
+# name -> (delays, failures) applied to the fixture server
+SCENARIOS = {
+    'healthy': ({}, {}),
+    'slow source (observer +0.5s)': ({'observer': 0.5}, {}),
+    'failing source (winnfm 503)': ({}, {'winnfm': 503}),
+    'hung source (sknis > timeout)': ({'sknis': SOURCE_TIMEOUT + 1}, {})
+}
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    return {'median_ms': round(statistics.median(samples) * 1000, 3), 'p95_ms': round(p95 * 1000, 3)}
+
+
+def timed(func, repeat, warmup=2):
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def start_environment(fixtures_dir):
+    """Start the fixture server and point a fresh app instance at it."""
+    # Separate loopback addresses keep per-host limits and breakers per source (Linux only)
+    host = '0.0.0.0' if sys.platform.startswith('linux') else '127.0.0.1'
+    server = FixtureServer(fixtures_dir, host=host).start()
+
+    workdir = tempfile.mkdtemp(prefix='securo-bench-')
+    from utils.news_sources import load_source_registry
+    sources_file = os.path.join(workdir, 'sources.json')
+    with open(sources_file, 'w') as f:
+        json.dump([{'id': s['id'], 'url': server.url(s['id'])} for s in load_source_registry()], f)
+
+    os.environ.update({
+        'INCIDENT_DB_PATH': os.path.join(workdir, 'incidents.db'),
+        'FEED_SOURCES_FILE': sources_file,
+        'FEED_SCHEDULER_ENABLED': 'false',
+        'FEED_DETAIL_CRAWL': 'false',
+        'FEED_SOURCE_TIMEOUT': str(SOURCE_TIMEOUT),
+        'FEED_FETCH_DEADLINE': str(FETCH_DEADLINE),
+        # Politeness limits would dominate back-to-back fetches of the same page
+        'FEED_HOST_RATE': '10000',
+        'FEED_HOST_BURST': '10000'
+    })
+
+    import logging
+    logging.disable(logging.CRITICAL)
+    import app as securo
+    return server, securo
+
+
+def reset_hosts(securo, aggregator):
+    from utils.host_guard import HostGuard
+    aggregator.host_guard = HostGuard(rate=securo.FEED_HOST_RATE, burst=securo.FEED_HOST_BURST,
+                                      failure_threshold=securo.FEED_BREAKER_THRESHOLD,
+                                      base_delay=securo.FEED_BREAKER_BASE_DELAY,
+                                      max_delay=securo.FEED_BREAKER_MAX_DELAY)
+    for source in aggregator.sources.values():
+        source['http_cache'] = aggregator.new_http_cache()
+
+
+def wait_idle(aggregator, timeout=10):
+    deadline = time.monotonic() + timeout
+    while aggregator.in_flight and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='Write results as JSON for run-to-run comparison')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    server, securo = start_environment(args.fixtures)
+    aggregator = securo.crime_aggregator
+    client = securo.app.test_client()
+    from utils.crime_classifier import CrimeClassifier
+
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parser_backend': aggregator.article_parser.backend,
+            'fixtures': 'recorded' if os.path.exists(os.path.join(args.fixtures, 'manifest.json')) else 'synthetic',
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'fetch': {}, 'parse': {}, 'classification': {}, 'end_to_end': {}
+    }
+
+    print(f"Fixtures: {results['environment']['fixtures']} ({args.fixtures}); "
+          f"parser backend: {results['environment']['parser_backend']}")
+
+    # 1. Fetch latency: full GET and conditional revalidation (unchanged body hash)
+    print("\nFetch latency per source (local replay)")
+    for source_id in aggregator.sources:
+        def cold_fetch():
+            aggregator.sources[source_id]['http_cache'] = aggregator.new_http_cache()
+            aggregator.fetch_source_page(source_id)
+        cold = timed(cold_fetch, args.repeat)
+        warm = timed(lambda: aggregator.fetch_source_page(source_id), args.repeat)
+        results['fetch'][source_id] = {'full': cold, 'revalidate': warm}
+        print(f"   {source_id:10s} full {cold['median_ms']:8.2f} ms   revalidate {warm['median_ms']:8.2f} ms")
+
+    # 2. Parse time per listing page
+    print("\nParse time per listing page")
+    titles = []
+    for source_id, source in aggregator.sources.items():
+        page = server.page(source_id)
+        stats = timed(lambda: aggregator.article_parser.parse(page, source['layout']), args.repeat)
+        titles.extend(a['title'] for a in aggregator.article_parser.parse(page, source['layout']))
+        results['parse'][source_id] = {**stats, 'bytes': len(page)}
+        print(f"   {source_id:10s} {stats['median_ms']:8.2f} ms  ({len(page) / 1024:.0f} KiB)")
+
+    # 3. Classification throughput on the fixture headlines
+    corpus = (titles or ['Police arrest suspect']) * (20000 // max(1, len(titles)) + 1)
+    corpus = corpus[:20000]
+    started = time.perf_counter()
+    classifier = CrimeClassifier()
+    for title in corpus:
+        classifier.classify(title)
+    elapsed = time.perf_counter() - started
+    results['classification'] = {'titles': len(corpus), 'titles_per_second': round(len(corpus) / elapsed)}
+    print(f"\nClassification: {results['classification']['titles_per_second']:,} titles/s "
+          f"({len(corpus):,} fixture headlines, fresh classifier)")
+
+    # 4. End-to-end API latency per scenario: served from the snapshot, and with a
+    #    synchronous refresh on every request (the no-scheduler path)
+    print("\n/api/live-feed-data latency")
+    for name, (delays, failures) in SCENARIOS.items():
+        server.delays, server.failures = dict(delays), dict(failures)
+        wait_idle(aggregator)
+        reset_hosts(securo, aggregator)
+
+        refresh = timed(aggregator.fetch_real_crime_data, max(3, args.repeat // 3), warmup=1)
+
+        securo.feed_scheduler.stale_after = 10 ** 9
+        cached = timed(lambda: client.get('/api/live-feed-data?per_page=10'), args.repeat)
+
+        securo.feed_scheduler.stale_after = -1
+        revalidating = timed(lambda: client.get('/api/live-feed-data?per_page=10'), max(3, args.repeat // 3), warmup=1)
+
+        snapshot = aggregator.get_snapshot()
+        results['end_to_end'][name] = {
+            'refresh': refresh,
+            'request_cached': cached,
+            'request_with_refresh': revalidating,
+            'source_status': {sid: status['status'] for sid, status in snapshot['source_status'].items()}
+        }
+        print(f"   {name}")
+        print(f"      refresh            {refresh['median_ms']:8.2f} ms (p95 {refresh['p95_ms']:.2f})")
+        print(f"      request (cached)   {cached['median_ms']:8.2f} ms (p95 {cached['p95_ms']:.2f})")
+        print(f"      request + refresh  {revalidating['median_ms']:8.2f} ms (p95 {revalidating['p95_ms']:.2f})")
+        print(f"      sources: {results['end_to_end'][name]['source_status']}")
+
+    server.delays, server.failures = {}, {}
+    wait_idle(aggregator)
+    server.stop()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
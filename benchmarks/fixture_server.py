@@ -0,0 +1,215 @@
+"""
+Record/replay harness for the live feed news sources.
+
+Record snapshots every registered source's listing page into a fixture
+directory; serve replays them from a local stand-in HTTP server, optionally
+with injected per-source delays and failures.
+
+Usage:
+    python benchmarks/fixture_server.py record [--fixtures benchmarks/fixtures]
+    python benchmarks/fixture_server.py serve [--fixtures DIR] [--port 8765]
+                                              [--delay observer=2.5] [--fail winnfm=503]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MANIFEST = 'manifest.json'
+
+HEADLINES = [
+    'Police arrest suspect in Basseterre robbery', 'Man charged with murder in Sandy Point',
+    'Minister opens new school in Cayon', 'Shooting under investigation at Frigate Bay',
+    'RSCNPF seizes drugs at port', 'Cricket team wins regional title',
+    'Woman injured in stabbing on Bay Road', 'Traffic collision on Government Road, Nevis',
+    'Police seeking witnesses to Charlestown burglary', 'Tourism numbers rise this season',
+    'Officer commended for patrol work', 'Court remands man on firearm possession charge'
+]
+
+
+def record(fixtures_dir, timeout=15):
+    """Save every registered source's listing page and a manifest describing them."""
+    import requests
+    from utils.news_sources import load_source_registry
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    manifest = {'recorded_at': datetime.now().isoformat(), 'sources': {}}
+
+    for source in load_source_registry():
+        source_id = source['id']
+        try:
+            response = requests.get(source['url'], timeout=timeout, headers={'User-Agent': 'Mozilla/5.0'})
+        except requests.RequestException as e:
+            print(f"   ⚠️ {source_id}: {e}")
+            continue
+
+        path = os.path.join(fixtures_dir, f'{source_id}.html')
+        with open(path, 'wb') as f:
+            f.write(response.content)
+
+        manifest['sources'][source_id] = {
+            'url': source['url'],
+            'file': f'{source_id}.html',
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type', 'text/html'),
+            'sha256': hashlib.sha256(response.content).hexdigest(),
+            'bytes': len(response.content)
+        }
+        print(f"   ✅ {source_id}: {len(response.content):,} bytes (HTTP {response.status_code})")
+
+    with open(os.path.join(fixtures_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def synthetic_listing(source_id, articles=40):
+    """Deterministic stand-in listing page, used when no recording exists for a source."""
+    rng = random.Random(source_id)
+    head = '<style>' + '.post{padding:1em}' * 300 + '</style>' + '<script>' + 'track();' * 500 + '</script>'
+    nav = '<nav>' + ''.join(f'<a href="/section/{i}">Section {i}</a>' for i in range(60)) + '</nav>'
+    items = []
+    for i in range(articles):
+        items.append(
+            f'<article class="post entry news-item"><h2><a href="/{source_id}/news/{i}">'
+            f'{rng.choice(HEADLINES)} ({source_id} {i})</a></h2>'
+            f'<time datetime="2025-03-{1 + i % 28:02d}T09:00:00">March {1 + i % 28}, 2025</time>'
+            f'<div class="excerpt"><p>{"Police are investigating the matter. " * 6}</p></div></article>'
+        )
+    return (f'<!DOCTYPE html><html><head>{head}</head><body>{nav}<main>{"".join(items)}</main>'
+            f'<footer>{"<p>Footer</p>" * 40}</footer></body></html>').encode()
+
+
+class FixtureServer:
+    """
+    Local stand-in for the news sites. ``/<source_id>/`` serves that source's
+    recorded page (or a synthetic one). Delays and failures can be changed
+    while the server runs, so one server covers every benchmark scenario.
+    """
+
+    def __init__(self, fixtures_dir=DEFAULT_FIXTURES, host='127.0.0.1', port=0):
+        self.fixtures_dir = fixtures_dir
+        self.delays = {}      # source_id -> seconds before responding
+        self.failures = {}    # source_id -> HTTP status to return instead of the page
+        self.requests = {}    # source_id -> request count
+        self.pages = self._load_pages()
+        self.loopback = {}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+        self._thread = None
+
+    def _load_pages(self):
+        pages = {}
+        manifest_path = os.path.join(self.fixtures_dir, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            for source_id, entry in manifest['sources'].items():
+                with open(os.path.join(self.fixtures_dir, entry['file']), 'rb') as f:
+                    pages[source_id] = f.read()
+        return pages
+
+    def page(self, source_id):
+        if source_id not in self.pages:
+            self.pages[source_id] = synthetic_listing(source_id)
+        return self.pages[source_id]
+
+    def url(self, source_id):
+        """Replay URL for a source. When bound to every interface each source gets its
+        own loopback address, so per-host rate limits and breakers stay per source."""
+        if self.host != '0.0.0.0':
+            return f'http://{self.host}:{self.port}/{source_id}/'
+        if source_id not in self.loopback:
+            self.loopback[source_id] = f'127.0.0.{len(self.loopback) + 1}'
+        return f'http://{self.loopback[source_id]}:{self.port}/{source_id}/'
+
+    def handle(self, request):
+        source_id = request.path.strip('/').split('/')[0]
+        self.requests[source_id] = self.requests.get(source_id, 0) + 1
+
+        delay = self.delays.get(source_id)
+        if delay:
+            time.sleep(delay)
+
+        status = self.failures.get(source_id)
+        if status:
+            request.send_response(status)
+            request.send_header('Content-Length', '0')
+            request.end_headers()
+            return
+
+        body = self.page(source_id)
+        request.send_response(200)
+        request.send_header('Content-Type', 'text/html; charset=utf-8')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        try:
+            request.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up first, e.g. a scraper timing out on a delayed source
+            pass
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def parse_overrides(values, cast):
+    overrides = {}
+    for value in values or []:
+        source_id, _, setting = value.partition('=')
+        overrides[source_id] = cast(setting)
+    return overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('mode', choices=['record', 'serve'])
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', action='append', help='source_id=seconds')
+    parser.add_argument('--fail', action='append', help='source_id=http_status')
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        print(f"Recording news source fixtures into {args.fixtures}")
+        record(args.fixtures)
+        return
+
+    server = FixtureServer(args.fixtures, port=args.port)
+    server.delays.update(parse_overrides(args.delay, float))
+    server.failures.update(parse_overrides(args.fail, int))
+    print(f"Serving fixtures from {args.fixtures} on http://{server.host}:{server.port}/<source_id>/")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: article list extraction per HTML parser backend.
+
+Parses saved news listing pages (or synthetic ones) with every installed
+ArticleParser backend plus the original full-page BeautifulSoup html.parser
+scan, and reports parse time per page.
+
+Usage:
+    python benchmarks/parser_benchmark.py [--fixtures DIR] [--repeat 20] [--articles 60]
+"""
+
+import os
+import sys
+import glob
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.article_parser import ArticleParser, available_backends  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Same layout as the SKNIS and WINN FM sources
+LAYOUT = {
+    'articles': [['article.post', 'article.news-item', 'article.entry', 'div.post', 'div.news-item', 'div.entry']],
+    'title': [['h1', 'h2', 'h3', 'a']],
+    'limit': 15
+}
+
+HEADLINES = ['Police arrest suspect in Basseterre robbery', 'Man charged with murder in Sandy Point',
+             'Minister opens new school in Cayon', 'Shooting under investigation at Frigate Bay',
+             'RSCNPF seizes drugs at port', 'Cricket team wins regional title']
+
+
+def build_page(articles, seed):
+    """A WordPress-style listing page: heavy head, navigation, scripts and an article list."""
+    rng = random.Random(seed)
+    head = ''.join(f'<link rel="stylesheet" href="/wp-content/style-{i}.css">' for i in range(40))
+    head += '<style>' + 'body{margin:0}.post{padding:1em}' * 400 + '</style>'
+    head += '<script>' + 'window.dataLayer=window.dataLayer||[];' * 600 + '</script>'
+    nav = '<nav><ul>' + ''.join(f'<li><a href="/category/{i}">Section {i}</a></li>' for i in range(80)) + '</ul></nav>'
+    items = []
+    for i in range(articles):
+        items.append(
+            f'<article class="post entry"><h2><a href="/news/{i}">{rng.choice(HEADLINES)}</a></h2>'
+            f'<span class="date">March {rng.randint(1, 28)}, 2025</span>'
+            f'<div class="excerpt"><p>{"Lorem ipsum dolor sit amet. " * 12}</p></div>'
+            f'<script>ads.push({i});</script></article>'
+        )
+    sidebar = '<aside>' + ''.join(f'<div class="widget"><a href="/tag/{i}">Tag {i}</a></div>' for i in range(200)) + '</aside>'
+    return (f'<!DOCTYPE html><html><head>{head}</head><body>{nav}<main>{"".join(items)}</main>'
+            f'{sidebar}<footer>{"<p>Footer</p>" * 50}</footer></body></html>').encode()
+
+
+def legacy_parse(content):
+    """The original scraper path: full html.parser soup, then find_all over every tag."""
+    soup = BeautifulSoup(content, 'html.parser')
+    articles = soup.find_all(['article', 'div'], class_=['post', 'news-item', 'entry'])
+    return [article.find(['h1', 'h2', 'h3', 'a']).get_text().strip() for article in articles[:15]]
+
+
+def time_it(func, pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            func(page)
+    return (time.perf_counter() - started) / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', help='Directory of saved *.html listing pages')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--articles', type=int, default=60, help='Articles per synthetic page')
+    args = parser.parse_args()
+
+    if args.fixtures:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(args.fixtures, '*.html'))):
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        if not pages:
+            parser.error(f"No *.html fixtures found in {args.fixtures}")
+        label = f"{len(pages)} fixture pages from {args.fixtures}"
+    else:
+        pages = [build_page(args.articles, seed) for seed in range(5)]
+        label = f"{len(pages)} synthetic pages, {args.articles} articles each"
+
+    print(f"Pages: {label} ({sum(len(p) for p in pages) / len(pages) / 1024:.0f} KiB average)")
+
+    results = {}
+    if BeautifulSoup is not None:
+        seconds = time_it(legacy_parse, pages, args.repeat)
+        results['legacy html.parser (full page)'] = seconds
+
+    extracted = {}
+    for backend in available_backends():
+        article_parser = ArticleParser(backend)
+        extracted[backend] = [[a['title'] for a in article_parser.parse(page, LAYOUT)] for page in pages]
+        results[backend] = time_it(lambda page: article_parser.parse(page, LAYOUT), pages, args.repeat)
+
+    baseline = results.get('legacy html.parser (full page)')
+    for name, seconds in results.items():
+        speedup = f"  {baseline / seconds:5.1f}x" if baseline else ''
+        print(f"{name:32s} {seconds * 1000:8.2f} ms/page{speedup}")
+
+    titles = list(extracted.values())
+    agree = all(t == titles[0] for t in titles)
+    print(f"Backends extract identical titles: {'yes' if agree else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
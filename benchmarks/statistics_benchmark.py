@@ -0,0 +1,158 @@
+"""
+Benchmark: legacy per-pattern regex scans vs the single-pass CrimeStatisticsScanner.
+
+Extracts crime statistics from saved report texts (or synthetic ones) with
+the original extract_crime_statistics scans and with the compiled scanner,
+checks both give identical results and reports throughput in MB/s.
+
+Usage:
+    python benchmarks/statistics_benchmark.py [--fixtures DIR] [--reports 40] [--kib 64] [--repeat 5]
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.crime_statistics import CrimeStatisticsScanner  # noqa: E402
+
+# Same patterns as SECUROPDFDataIntegrator
+CRIME_PATTERNS = {
+    'violent_crimes': [r'violent\s+crime[s]?', r'assault[s]?', r'robbery', r'murder[s]?', r'homicide[s]?'],
+    'property_crimes': [r'property\s+crime[s]?', r'burglary', r'breaking\s+and\s+entering', r'theft[s]?', r'larceny'],
+    'drug_offenses': [r'drug\s+offense[s]?', r'narcotics', r'drug\s+possession', r'trafficking'],
+    'fraud': [r'fraud', r'forgery', r'embezzlement', r'financial\s+crime[s]?']
+}
+
+LABELS = ['violent crimes', 'assaults', 'robbery', 'murders', 'homicides', 'property crimes', 'burglary',
+          'breaking and entering', 'thefts', 'larceny', 'drug offenses', 'narcotics', 'drug possession',
+          'trafficking', 'fraud', 'forgery', 'embezzlement', 'financial crimes', 'total crimes', 'total',
+          'overall', 'killings', 'clearance rate', 'solved', 'resolution', 'Homicide', 'TOTAL CRIMES']
+FILLER = ['the', 'police', 'force', 'reported', 'in', 'the period', 'compared', 'with', 'Basseterre',
+          'Nevis', 'division', 'cases', 'detected', 'page', 'RSCNPF', 'Report', 'unsolved', 'subtotal',
+          'assaulted', 'fraudulent', '%', '-', '|', '(', ')', ':']
+SEPARATORS = [' ', ' ', ' ', ': ', ':', '\n', '  ', '\t', '']
+
+
+def legacy_extract(text):
+    """The original extract_crime_statistics scans, kept verbatim for comparison."""
+    stats = {'total_crimes': 0, 'violent_crimes': 0, 'property_crimes': 0, 'drug_offenses': 0,
+             'fraud': 0, 'homicides': 0, 'clearance_rate': 0, 'extracted_numbers': []}
+    text = text.lower()
+
+    numbers = re.findall(r'\b\d{1,4}\b', text)
+    stats['extracted_numbers'] = [int(n) for n in numbers if 1 <= int(n) <= 5000]
+
+    for crime_type, patterns in CRIME_PATTERNS.items():
+        for pattern in patterns:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                start = max(0, match.start() - 50)
+                end = min(len(text), match.end() + 50)
+                context_numbers = re.findall(r'\b(\d{1,4})\b', text[start:end])
+                for num_str in context_numbers:
+                    num = int(num_str)
+                    if 1 <= num <= 2000:
+                        stats[crime_type] = max(stats[crime_type], num)
+                        break
+
+    for field, patterns, (low, high) in [
+        ('total_crimes', [r'total\s+crime[s]?[:\s]+(\d{1,4})', r'total[:\s]+(\d{1,4})',
+                          r'overall[:\s]+(\d{1,4})'], (500, 5000)),
+        ('homicides', [r'homicide[s]?[:\s]+(\d{1,3})', r'murder[s]?[:\s]+(\d{1,3})',
+                       r'killing[s]?[:\s]+(\d{1,3})'], (0, 100)),
+        ('clearance_rate', [r'clearance\s+rate[:\s]+(\d{1,3})%?', r'solved[:\s]+(\d{1,3})%?',
+                            r'resolution[:\s]+(\d{1,3})%?'], (0, 100))
+    ]:
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                value = int(match.group(1))
+                if low <= value <= high:
+                    stats[field] = value
+                    break
+    return stats
+
+
+def compiled_extract(scanner, text):
+    stats = {'total_crimes': 0, 'violent_crimes': 0, 'property_crimes': 0, 'drug_offenses': 0,
+             'fraud': 0, 'homicides': 0, 'clearance_rate': 0, 'extracted_numbers': []}
+    stats.update(scanner.extract(text))
+    return stats
+
+
+def build_report(size, seed):
+    """
+    Report-like text of roughly ``size`` characters: label/number tables and
+    prose, plus what PDF text extraction produces (labels run together,
+    long digit runs, numbers glued to words).
+    """
+    rng = random.Random(seed)
+    parts, length = [], 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.35:
+            part = rng.choice(LABELS)
+        elif roll < 0.7:
+            part = str(rng.choice([rng.randint(0, 60), rng.randint(0, 3000), rng.randint(0, 99999)]))
+        else:
+            part = rng.choice(FILLER)
+        part += rng.choice(SEPARATORS)
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)
+
+
+def time_it(func, texts, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', help='Directory of saved *.txt report texts')
+    parser.add_argument('--reports', type=int, default=40, help='Synthetic reports')
+    parser.add_argument('--kib', type=int, default=64, help='Size of each synthetic report')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        texts = []
+        for path in sorted(glob.glob(os.path.join(args.fixtures, '*.txt'))):
+            with open(path, encoding='utf-8') as f:
+                texts.append(f.read())
+        if not texts:
+            parser.error(f"No *.txt fixtures found in {args.fixtures}")
+        label = f"{len(texts)} fixture reports from {args.fixtures}"
+    else:
+        texts = [build_report(args.kib * 1024, args.seed + i) for i in range(args.reports)]
+        label = f"{len(texts)} synthetic reports (seed {args.seed})"
+
+    megabytes = sum(len(text.encode('utf-8')) for text in texts) * args.repeat / 1e6
+    print(f"Corpus: {label}, {megabytes / args.repeat:.1f} MB")
+
+    started = time.perf_counter()
+    scanner = CrimeStatisticsScanner(CRIME_PATTERNS)
+    print(f"Scanner compile time: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    differences = sum(1 for text in texts if legacy_extract(text) != compiled_extract(scanner, text))
+
+    legacy_time = time_it(legacy_extract, texts, args.repeat)
+    compiled_time = time_it(lambda text: compiled_extract(scanner, text), texts, args.repeat)
+
+    print(f"Legacy per-pattern scans: {legacy_time:.3f}s  ({megabytes / legacy_time:6.2f} MB/s)")
+    print(f"Compiled single pass:     {compiled_time:.3f}s  ({megabytes / compiled_time:6.2f} MB/s)")
+    print(f"Speedup: {legacy_time / compiled_time:.2f}x")
+    print(f"Reports with differing statistics: {differences} of {len(texts)}")
+
+
+if __name__ == '__main__':
+    main()
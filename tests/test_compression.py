@@ -0,0 +1,42 @@
+import gzip
+import importlib
+import os
+
+import pytest
+
+brotli = pytest.importorskip('brotli')
+
+
+@pytest.fixture(scope='module')
+def client(tmp_path_factory):
+    os.environ['FEED_SCHEDULER_ENABLED'] = 'false'
+    os.environ['INCIDENT_DB_PATH'] = str(tmp_path_factory.mktemp('db') / 'incidents.db')
+    app_module = importlib.import_module('app')
+    # The statistics payloads are small; compress everything so they exercise negotiation
+    original, app_module.COMPRESSION_MIN_SIZE = app_module.COMPRESSION_MIN_SIZE, 0
+    yield app_module.app.test_client()
+    app_module.COMPRESSION_MIN_SIZE = original
+
+
+def statistics_url():
+    from app import COMPREHENSIVE_HISTORICAL_DATA
+    return f'/api/crime-statistics/{next(iter(COMPREHENSIVE_HISTORICAL_DATA))}'
+
+
+def test_brotli_preferred_when_accepted(client):
+    plain = client.get(statistics_url())
+    response = client.get(statistics_url(), headers={'Accept-Encoding': 'gzip, br'})
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.headers['ETag'] == plain.headers['ETag'][:-1] + '-br"'
+    assert brotli.decompress(response.data) == plain.data
+
+
+def test_gzip_without_brotli(client):
+    plain = client.get(statistics_url())
+    response = client.get(statistics_url(), headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+    assert gzip.decompress(response.data) == plain.data
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from utils.date_normalizer import DateNormalizer
+
+
+def test_ambiguous_date_does_not_depend_on_earlier_dates():
+    first = DateNormalizer()
+    before = first.normalize('03/05/2025', 'us_outlet')
+    first.normalize('03/15/2025', 'us_outlet')
+    # Different string, same date, so the memo cannot hide what the parser does now
+    after = first.normalize('3/5/2025', 'us_outlet')
+
+    fresh = DateNormalizer()
+    fresh.normalize('03/15/2025', 'us_outlet')
+
+    assert before == after == fresh.normalize('03/05/2025', 'us_outlet') == datetime(2025, 5, 3)
+
+
+def test_unambiguous_date_teaches_the_source_format():
+    normalizer = DateNormalizer()
+    assert normalizer.normalize('03/15/2025', 'us_outlet') == datetime(2025, 3, 15)
+    assert normalizer.source_formats['us_outlet'] == '%m/%d/%Y'
+
+    normalizer.normalize('03/05/2025', 'us_outlet')
+    assert normalizer.source_formats['us_outlet'] == '%m/%d/%Y'
+
+
+def test_declared_format_settles_ambiguity():
+    normalizer = DateNormalizer(declared_formats={'us_outlet': '%m/%d/%Y'})
+    assert normalizer.normalize('03/05/2025', 'us_outlet') == datetime(2025, 3, 5)
+    assert normalizer.normalize('03/05/2025', 'other') == datetime(2025, 5, 3)
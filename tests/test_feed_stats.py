@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from utils.incident_store import IncidentStore
+
+
+def incident(incident_id, status='Active', hours_ago=1):
+    return {
+        'id': incident_id,
+        'timestamp': (datetime.now() - timedelta(hours=hours_ago)).isoformat(),
+        'severity': 'medium',
+        'location': 'Basseterre',
+        'type': 'theft',
+        'status': status,
+        'data_type': 'real_news',
+        'title': incident_id
+    }
+
+
+def test_active_counts_only_the_latest_snapshot(tmp_path):
+    store = IncidentStore(str(tmp_path / 'incidents.db'))
+    store.sync([incident('a'), incident('b'), incident('c', status='Closed'), incident('d', hours_ago=48)])
+    assert store.stats()['active_incidents'] == 3
+
+    # The next refresh no longer lists a, b and d: they stay stored but stop counting
+    store.sync([incident('c', status='Closed'), incident('e')])
+    stats = store.stats()
+    assert store.count() == 5
+    assert stats['active_incidents'] == 1
+    assert stats['real_news'] == 2
+
+
+def test_restart_does_not_count_stored_history(tmp_path):
+    path = str(tmp_path / 'incidents.db')
+    store = IncidentStore(path)
+    store.sync([incident(f'old-{i}') for i in range(5)])
+    store.sync([incident('current')])
+
+    restarted = IncidentStore(path)
+    assert restarted.stats()['active_incidents'] == 1
+    assert restarted.stats()['real_news'] == 1
+
+
+def test_counters_from_an_older_version_are_rebuilt(tmp_path):
+    path = str(tmp_path / 'incidents.db')
+    store = IncidentStore(path)
+    store.sync([incident(f'old-{i}') for i in range(5)])
+    store.sync([incident('current')])
+    with store.conn:
+        store.conn.execute("UPDATE feed_stats SET value = 6 WHERE key = 'active'")
+        store.conn.execute("UPDATE feed_meta SET value = 1 WHERE key = 'stats_ready'")
+
+    assert IncidentStore(path).stats()['active_incidents'] == 1
@@ -0,0 +1,173 @@
+import time
+import heapq
+import logging
+import itertools
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class ArticleDetailCrawler:
+    """
+    Background crawler for full article pages.
+
+    URLs are queued at most once per process and handled by a small pool of
+    daemon threads, never more than ``per_host`` at a time for one host.
+    Queued items sit in a heap ordered by the time they may run. An item
+    whose host is busy is parked until that host's fetch finishes, and one
+    the host guard would hold back is rescheduled for when it reports the
+    host free, so workers sleep instead of cycling through blocked items.
+    The queue is bounded: when it is full new URLs are dropped and picked up
+    again on a later refresh, so a slow outlet can never build up unbounded
+    work.
+    """
+
+    def __init__(self, handler: Callable[[Dict], bool], workers: int = 2, per_host: int = 1,
+                 max_pending: int = 200, is_new: Optional[Callable[[List[str]], List[str]]] = None,
+                 wait_time: Optional[Callable[[str], float]] = None):
+        """
+        Args:
+            handler (Callable[[Dict], bool]): Fetches and stores one queued item
+                (a dict with at least 'url'); returns True on success
+            workers (int): Crawler threads
+            per_host (int): Concurrent fetches allowed per host
+            max_pending (int): Queued and in-flight items allowed at once
+            is_new (Optional[Callable]): Filters a list of URLs down to those never
+                crawled before, e.g. against persistent storage
+            wait_time (Optional[Callable[[str], float]]): Seconds until a URL's host
+                may be contacted, e.g. HostGuard.wait_time; 0 means now
+        """
+        self.handler = handler
+        self.workers = workers
+        self.per_host = per_host
+        self.max_pending = max_pending
+        self.is_new = is_new
+        self.wait_time = wait_time
+
+        # (run at, insertion order, item) by time.monotonic(); the order keeps ties FIFO
+        self._scheduled: List[Tuple[float, int, Dict]] = []
+        self._order = itertools.count()
+        # Items due but waiting for a busy host, per host
+        self._parked: Dict[str, Deque[Dict]] = {}
+        self._pending = set()
+        self._host_active: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._threads: List[threading.Thread] = []
+
+        # Guarded by _lock: updated from the submitting thread and every worker
+        self.stats = {'queued': 0, 'fetched': 0, 'failed': 0, 'dropped': 0, 'deferred': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def start(self) -> None:
+        """Start the worker threads if they are not running yet."""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'article-crawler-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, items: List[Dict]) -> int:
+        """
+        Queue article pages that have not been crawled yet. Never blocks.
+
+        Args:
+            items (List[Dict]): Items with a 'url' plus whatever the handler needs
+
+        Returns:
+            int: Number of items queued
+        """
+        with self._lock:
+            candidates = {item['url']: item for item in items
+                          if item.get('url') and item['url'] not in self._pending}
+        if not candidates:
+            return 0
+
+        urls = self.is_new(list(candidates)) if self.is_new else list(candidates)
+
+        queued = 0
+        with self._lock:
+            for url in urls:
+                if url in self._pending:
+                    continue
+                if len(self._pending) >= self.max_pending:
+                    self.stats['dropped'] += 1
+                    continue
+                self._pending.add(url)
+                self._schedule(candidates[url], 0.0)
+                queued += 1
+            self.stats['queued'] += queued
+
+        if queued:
+            self.start()
+        return queued
+
+    @staticmethod
+    def _host(item: Dict) -> str:
+        return urlparse(item['url']).hostname or ''
+
+    def _schedule(self, item: Dict, delay: float) -> None:
+        """Queue an item to run after ``delay`` seconds. Caller holds _lock."""
+        heapq.heappush(self._scheduled, (time.monotonic() + delay, next(self._order), item))
+        self._wakeup.notify()
+
+    def _next_item(self) -> Dict:
+        """Block until an item is due and its host is free, then claim the host."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                if self._scheduled and self._scheduled[0][0] <= now:
+                    item = heapq.heappop(self._scheduled)[2]
+                    host = self._host(item)
+                    if self._host_active.get(host, 0) >= self.per_host:
+                        self._parked.setdefault(host, deque()).append(item)
+                        continue
+                    delay = self.wait_time(item['url']) if self.wait_time else 0.0
+                    if delay > 0:
+                        # Rate limited or circuit open: come back when the guard says the host is free
+                        self.stats['deferred'] += 1
+                        self._schedule(item, delay)
+                        continue
+                    self._host_active[host] = self._host_active.get(host, 0) + 1
+                    return item
+
+                self._wakeup.wait(self._scheduled[0][0] - now if self._scheduled else None)
+
+    def _finish(self, item: Dict, outcome: str) -> None:
+        """Record a handled item and hand its host slot to the next parked item."""
+        host = self._host(item)
+        with self._lock:
+            self.stats[outcome] += 1
+            self._pending.discard(item['url'])
+            self._host_active[host] -= 1
+            parked = self._parked.get(host)
+            if parked:
+                self._schedule(parked.popleft(), 0.0)
+                if not parked:
+                    del self._parked[host]
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_item()
+            outcome = 'failed'
+            try:
+                if self.handler(item):
+                    outcome = 'fetched'
+            except Exception as e:
+                self.logger.warning(f"Article detail fetch failed for {item['url']}: {str(e)}")
+            finally:
+                self._finish(item, outcome)
+
+    def status(self) -> Dict:
+        """Crawler counters for status endpoints."""
+        with self._lock:
+            return {
+                **self.stats,
+                'pending': len(self._scheduled) + sum(len(parked) for parked in self._parked.values()),
+                'in_flight': sum(self._host_active.values()),
+                'workers': self.workers,
+                'per_host': self.per_host
+            }
@@ -0,0 +1,291 @@
+import os
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = None
+
+
+# Fastest first; FEED_HTML_PARSER picks one explicitly
+BACKEND_PREFERENCE = ['selectolax', 'lxml', 'html.parser']
+
+# Everything before <body> and every script/style block is skipped before parsing
+BODY_START = re.compile(rb'<body[\s>]', re.IGNORECASE)
+NON_CONTENT_BLOCKS = re.compile(rb'<(script|style|noscript|svg)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# Default article list layout shared by the St. Kitts and Nevis news sites
+DEFAULT_LAYOUT = {
+    'date': [['time'], ['span.date', 'span.published']],
+    'description': [['div.content', 'div.excerpt', 'div.summary'], ['p']]
+}
+
+# Where the story text lives on an article page (WordPress and common CMS themes)
+DEFAULT_DETAIL_LAYOUT = {
+    'body': [['div.entry-content', 'div.post-content', 'div.article-content', 'div.article-body',
+              'div.td-post-content', 'div.story-content'], ['article'], ['main']],
+    'paragraphs': ['p']
+}
+
+
+def available_backends() -> List[str]:
+    """Installed parser backends, fastest first."""
+    installed = {
+        'selectolax': LexborHTMLParser is not None,
+        'lxml': lxml is not None,
+        'html.parser': BeautifulSoup is not None
+    }
+    return [name for name in BACKEND_PREFERENCE if installed[name]]
+
+
+def article_region(content: bytes) -> bytes:
+    """
+    Cut a page down to the part that can hold articles.
+
+    Args:
+        content (bytes): Raw page HTML
+
+    Returns:
+        bytes: Body markup without script, style, noscript and svg blocks
+    """
+    match = BODY_START.search(content)
+    if match:
+        content = content[match.start():]
+    return NON_CONTENT_BLOCKS.sub(b'', content)
+
+
+def parse_selector(selector: str) -> Tuple[str, Optional[str]]:
+    """Split a 'tag' or 'tag.class' selector into its parts."""
+    tag, _, css_class = selector.partition('.')
+    return tag, css_class or None
+
+
+class ArticleParser:
+    """
+    Extracts article teasers from a news listing page with the fastest
+    installed HTML parser: selectolax (lexbor), then lxml, then
+    BeautifulSoup's html.parser.
+
+    A layout describes where things are as selector groups. Each group is a
+    list of 'tag' or 'tag.class' selectors matched in document order; the
+    first group with a match wins, e.g. ``[['h2'], ['h3'], ['a']]`` prefers
+    an h2 over an h3 while ``[['h1', 'h2', 'h3', 'a']]`` takes whichever
+    comes first.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Args:
+            backend (Optional[str]): 'selectolax', 'lxml' or 'html.parser';
+                defaults to FEED_HTML_PARSER or the fastest installed backend. A
+                backend that is not installed falls back to the fastest one that is
+
+        Raises:
+            ValueError: If no backend is installed at all
+        """
+        backends = available_backends()
+        if not backends:
+            raise ValueError("No HTML parser backend is installed (selectolax, lxml or beautifulsoup4)")
+        requested = backend or os.environ.get('FEED_HTML_PARSER')
+        backend = requested if requested in backends else backends[0]
+        if requested and requested != backend:
+            # A missing optional dependency should slow parsing down, not stop the app from booting
+            logging.getLogger(__name__).warning(
+                f"HTML parser backend {requested!r} is not available, using {backend!r} (installed: {backends})"
+            )
+
+        self.backend = backend
+        self._xpaths: Dict[Tuple[bool, Tuple[str, ...]], object] = {}
+
+    def parse(self, content: bytes, layout: Dict) -> List[Dict]:
+        """
+        Extract articles from a listing page.
+
+        Args:
+            content (bytes): Raw page HTML
+            layout (Dict): 'articles', 'title', 'date' and 'description' selector
+                groups plus an optional article 'limit'
+
+        Returns:
+            List[Dict]: One dict per article with a title, holding 'title', 'link',
+            'date_text', 'date_value' (a <time> element's datetime attribute, if any)
+            and 'description' (full text, untruncated)
+        """
+        layout = {**DEFAULT_LAYOUT, **layout}
+        tree = self._tree(content, layout['articles'])
+        if tree is None:
+            return []
+        root, select, text, href, attr = tree
+
+        def first_group(node, groups, first_only):
+            for group in groups:
+                found = select(node, group, first_only)
+                if found:
+                    return found
+            return []
+
+        containers = first_group(root, layout['articles'], False)
+        if layout.get('limit'):
+            containers = containers[:layout['limit']]
+
+        articles = []
+        for container in containers:
+            title_elems = first_group(container, layout['title'], True)
+            if not title_elems:
+                continue
+            title_elem = title_elems[0]
+
+            # The link is the title element itself or the first anchor inside it
+            link_elems = [title_elem] if href(title_elem) is not None else select(title_elem, ['a'], True)
+            date_elems = first_group(container, layout['date'], True)
+            description_elems = first_group(container, layout['description'], True) or [container]
+
+            articles.append({
+                'title': text(title_elem).strip(),
+                'link': (href(link_elems[0]) if link_elems else None) or '',
+                'date_text': text(date_elems[0]) if date_elems else '',
+                'date_value': attr(date_elems[0], 'datetime') if date_elems else None,
+                'description': text(description_elems[0]).strip()
+            })
+
+        return articles
+
+    def parse_detail(self, content: bytes, layout: Optional[Dict] = None) -> str:
+        """
+        Extract the story text from an article page.
+
+        Args:
+            content (bytes): Raw article page HTML
+            layout (Optional[Dict]): 'body' selector groups and 'paragraphs' selectors
+
+        Returns:
+            str: Paragraph texts joined by blank lines, or '' if no body was found
+        """
+        layout = {**DEFAULT_DETAIL_LAYOUT, **(layout or {})}
+        tree = self._tree(content, layout['body'])
+        if tree is None:
+            return ''
+        root, select, text, _, _ = tree
+
+        for group in layout['body']:
+            bodies = select(root, group, True)
+            if bodies:
+                paragraphs = [text(p).strip() for p in select(bodies[0], layout['paragraphs'], False)]
+                return '\n\n'.join(p for p in paragraphs if p) or text(bodies[0]).strip()
+        return ''
+
+    def _tree(self, content: bytes, container_groups: List[List[str]]):
+        """Parse the article region, returning (root, select, text, href, attr) or None if empty."""
+        region = article_region(content)
+        if not region.strip():
+            return None
+
+        if self.backend == 'selectolax':
+            root = LexborHTMLParser(region).root
+            return root, self._select_selectolax, self._text_selectolax, self._href_selectolax, self._attr_selectolax
+        if self.backend == 'lxml':
+            root = lxml.html.fromstring(region)
+            return root, self._select_lxml, self._text_lxml, self._href_lxml, self._attr_lxml
+
+        # Keep only the container tags while parsing
+        tags = sorted({parse_selector(s)[0] for group in container_groups for s in group})
+        root = BeautifulSoup(region, 'html.parser', parse_only=SoupStrainer(tags))
+        return root, self._select_bs4, self._text_bs4, self._href_bs4, self._attr_bs4
+
+    # selectolax: CSS selectors; css() also matches the node itself and repeats
+    # an element once per selector it matches, so drop both
+    def _select_selectolax(self, node, group, first_only):
+        if first_only:
+            for match in node.css(', '.join(group)):
+                if match.mem_id != node.mem_id:
+                    return [match]
+            return []
+
+        seen = {node.mem_id}
+        found = []
+        for match in node.css(', '.join(group)):
+            if match.mem_id not in seen:
+                seen.add(match.mem_id)
+                found.append(match)
+        return found
+
+    @staticmethod
+    def _text_selectolax(node):
+        return node.text(deep=True)
+
+    @staticmethod
+    def _href_selectolax(node):
+        return node.attributes.get('href') if node.tag == 'a' else None
+
+    @staticmethod
+    def _attr_selectolax(node, name):
+        return node.attributes.get(name)
+
+    # lxml: each selector group becomes one compiled XPath union, evaluated in document order
+    def _select_lxml(self, node, group, first_only):
+        from_root = node.getparent() is None
+        key = (from_root, tuple(group))
+        xpath = self._xpaths.get(key)
+        if xpath is None:
+            # A parsed fragment's root may itself be an article container
+            axis = 'descendant-or-self' if from_root else 'descendant'
+            parts = []
+            for selector in group:
+                tag, css_class = parse_selector(selector)
+                step = f"{axis}::{tag}"
+                if css_class:
+                    step += f"[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+                parts.append(step)
+            xpath = self._xpaths[key] = etree.XPath(' | '.join(parts))
+        found = xpath(node)
+        return found[:1] if first_only else found
+
+    @staticmethod
+    def _text_lxml(node):
+        return node.text_content()
+
+    @staticmethod
+    def _href_lxml(node):
+        return node.get('href') if node.tag == 'a' else None
+
+    @staticmethod
+    def _attr_lxml(node, name):
+        return node.get(name)
+
+    # BeautifulSoup: only the article container tags are kept while parsing
+    def _select_bs4(self, node, group, first_only):
+        selectors = [parse_selector(selector) for selector in group]
+
+        def matches(tag):
+            return any(tag.name == name and (css_class is None or css_class in tag.get('class', []))
+                       for name, css_class in selectors)
+
+        if first_only:
+            found = node.find(matches)
+            return [found] if found else []
+        return node.find_all(matches)
+
+    @staticmethod
+    def _text_bs4(node):
+        return node.get_text()
+
+    @staticmethod
+    def _href_bs4(node):
+        return node.get('href') if node.name == 'a' else None
+
+    @staticmethod
+    def _attr_bs4(node, name):
+        return node.get(name)
@@ -0,0 +1,170 @@
+import re
+from typing import Dict, List, Optional
+
+
+CRIME_KEYWORDS = [
+    'murder', 'homicide', 'shooting', 'killed', 'death', 'died',
+    'robbery', 'burglary', 'theft', 'stolen', 'arrest', 'arrested',
+    'police', 'investigation', 'suspect', 'charged', 'court',
+    'violence', 'assault', 'attack', 'crime', 'criminal',
+    'drugs', 'trafficking', 'possession', 'fraud', 'scam',
+    'domestic violence', 'sexual assault', 'rape', 'kidnap',
+    'weapons', 'firearm', 'gun', 'stabbing', 'incident',
+    'emergency', 'patrol', 'officer', 'constable'
+]
+
+POLICE_KEYWORDS = [
+    'police', 'rscnpf', 'officer', 'constable', 'commissioner',
+    'crime', 'arrest', 'investigation', 'patrol', 'security',
+    'law enforcement', 'public safety', 'emergency'
+]
+
+# Evaluated in order; the first rule with a matching keyword wins
+CRIME_RULES = [
+    (['murder', 'homicide', 'killed', 'death', 'shooting', 'stabbing'],
+     {'category': 'violent', 'name': 'Homicide/Violent Crime'}, 'critical'),
+    (['assault', 'robbery', 'attack', 'violence', 'rape', 'kidnap'],
+     {'category': 'violent', 'name': 'Violent Crime'}, 'high'),
+    (['burglary', 'theft', 'stolen', 'breaking', 'vandalism'],
+     {'category': 'property', 'name': 'Property Crime'}, 'medium'),
+    (['drugs', 'trafficking', 'possession', 'narcotics'],
+     {'category': 'drug', 'name': 'Drug Offense'}, 'high'),
+    (['fraud', 'scam', 'financial', 'money laundering'],
+     {'category': 'fraud', 'name': 'Financial Crime'}, 'medium'),
+    (['traffic', 'accident', 'collision', 'hit and run', 'driving'],
+     {'category': 'traffic', 'name': 'Traffic Incident'}, 'low')
+]
+
+DEFAULT_CRIME_TYPE = ({'category': 'other', 'name': 'General Incident'}, 'medium')
+
+# Known locations in St. Kitts and Nevis, evaluated in order
+LOCATION_KEYWORDS = {
+    'basseterre': ['basseterre', 'independence square', 'bay road', 'central'],
+    'frigate-bay': ['frigate bay', 'frigate', 'resort', 'casino', 'marriott'],
+    'sandy-point': ['sandy point', 'newton ground', 'port'],
+    'charlestown': ['charlestown', 'nevis', 'government road', 'memorial square']
+}
+
+LOCATION_NAMES = {
+    'basseterre': 'Basseterre Central District',
+    'frigate-bay': 'Frigate Bay Tourism Zone',
+    'sandy-point': 'Sandy Point Township',
+    'charlestown': 'Charlestown (Nevis)'
+}
+
+DEFAULT_LOCATION = {'category': 'basseterre', 'name': 'St. Kitts and Nevis'}
+
+ACTIVE_STATUS_KEYWORDS = ['ongoing', 'investigating', 'seeking']
+
+# Common inflections accepted after a keyword: "murders", "gunned", "kidnapping", "gunman"
+INFLECTION_SUFFIX = r'(?:s|es|ed|ing|ped|ping|per|pers|ned|man|men)?'
+
+
+class CrimeClassifier:
+    """
+    Single-pass headline classifier for the SECURO live crime feed.
+
+    Every keyword table is compiled once into one word-boundary regex. A
+    title is scanned a single time and the matched keywords are resolved into
+    crime relevance, police relevance, crime type, severity, location and status.
+    Matching is on whole words plus common inflections, so "death" does not
+    match "deathly" and "port" does not match "report".
+    """
+
+    def __init__(self):
+        # keyword -> set of roles, e.g. {'crime', 'rule:0', 'location:sandy-point'}
+        self.roles: Dict[str, set] = {}
+
+        for keyword in CRIME_KEYWORDS:
+            self._add_role(keyword, 'crime')
+        for keyword in POLICE_KEYWORDS:
+            self._add_role(keyword, 'police')
+        for index, (keywords, _, _) in enumerate(CRIME_RULES):
+            for keyword in keywords:
+                self._add_role(keyword, f'rule:{index}')
+        for location_key, keywords in LOCATION_KEYWORDS.items():
+            for keyword in keywords:
+                self._add_role(keyword, f'location:{location_key}')
+        for keyword in ACTIVE_STATUS_KEYWORDS:
+            self._add_role(keyword, 'active')
+
+        # A keyword also carries the roles of the keywords nested inside it
+        # ("sexual assault" still counts as "assault", "arrested" as "arrest"),
+        # because the scan consumes the longest alternative only.
+        self.resolved: Dict[str, frozenset] = {}
+        for keyword in self.roles:
+            roles = set(self.roles[keyword])
+            for other in self.roles:
+                if other != keyword and re.search(rf'\b{re.escape(other)}{INFLECTION_SUFFIX}\b', keyword):
+                    roles |= self.roles[other]
+            self.resolved[keyword] = frozenset(roles)
+
+        alternatives = sorted(self.roles, key=len, reverse=True)
+        self.pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(k) for k in alternatives) + r')' + INFLECTION_SUFFIX + r'\b'
+        )
+
+        # Resolved results keyed by the set of keywords found; headlines reuse a
+        # small vocabulary, so this stays tiny and skips rule evaluation
+        self._results: Dict[frozenset, Dict] = {}
+
+    def _add_role(self, keyword: str, role: str) -> None:
+        self.roles.setdefault(keyword, set()).add(role)
+
+    def classify(self, title: str) -> Dict:
+        """
+        Classify an article title in one scan.
+
+        Args:
+            title (str): Article headline
+
+        Returns:
+            Dict: crime_related, police_related, crime_type, severity, location and status
+        """
+        keywords = frozenset(self.pattern.findall(title.lower()))
+        result = self._results.get(keywords)
+        if result is None:
+            result = self._resolve(keywords)
+            if len(self._results) < 4096:
+                self._results[keywords] = result
+        return {**result, 'crime_type': dict(result['crime_type']), 'location': dict(result['location'])}
+
+    def _resolve(self, keywords: frozenset) -> Dict:
+        roles = set()
+        for keyword in keywords:
+            roles |= self.resolved[keyword]
+
+        crime_type, severity = DEFAULT_CRIME_TYPE
+        for index, (_, rule_type, rule_severity) in enumerate(CRIME_RULES):
+            if f'rule:{index}' in roles:
+                crime_type, severity = rule_type, rule_severity
+                break
+
+        location = DEFAULT_LOCATION
+        for location_key in LOCATION_KEYWORDS:
+            if f'location:{location_key}' in roles:
+                location = {'category': location_key, 'name': LOCATION_NAMES[location_key]}
+                break
+
+        return {
+            'crime_related': 'crime' in roles,
+            'police_related': 'police' in roles,
+            'crime_type': dict(crime_type),
+            'severity': severity,
+            'location': dict(location),
+            'status': 'Active' if 'active' in roles else 'Reported'
+        }
+
+    def classify_many(self, titles: List[str]) -> List[Dict]:
+        return [self.classify(title) for title in titles]
+
+
+_default_classifier: Optional[CrimeClassifier] = None
+
+
+def get_classifier() -> CrimeClassifier:
+    """Shared classifier instance, compiled on first use."""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = CrimeClassifier()
+    return _default_classifier
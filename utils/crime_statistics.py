@@ -0,0 +1,200 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+# Recorded with every analyzed PDF report; bump it whenever a change to the
+# extraction here or to the integrator's year detection or confidence scoring
+# changes the statistics, so saved reports are analyzed again
+STATISTICS_VERSION = 2
+
+# Labelled values ("total crimes: 1127"). For each field the patterns are tried
+# in order; a pattern's first match decides unless its value is out of range.
+VALUE_PATTERNS = [
+    ('total_crimes', [
+        r'total\s+crime[s]?[:\s]+(\d{1,4})',
+        r'total[:\s]+(\d{1,4})',
+        r'overall[:\s]+(\d{1,4})'
+    ], (500, 5000)),
+    ('homicides', [
+        r'homicide[s]?[:\s]+(\d{1,3})',
+        r'murder[s]?[:\s]+(\d{1,3})',
+        r'killing[s]?[:\s]+(\d{1,3})'
+    ], (0, 100)),
+    ('clearance_rate', [
+        r'clearance\s+rate[:\s]+(\d{1,3})%?',
+        r'solved[:\s]+(\d{1,3})%?',
+        r'resolution[:\s]+(\d{1,3})%?'
+    ], (0, 100))
+]
+
+# Characters searched on each side of a crime-type label for its count
+CONTEXT_CHARS = 50
+
+# After str.lower() these are the only characters re.IGNORECASE matches to a
+# different ASCII letter (dotless i, long s); text without them is scanned
+# case-sensitively, which is about three times faster
+FOLDED_LETTERS = {'\u0131': 'i', '\u017f': 's'}
+UNFOLD = str.maketrans(FOLDED_LETTERS)
+
+NUMBER = r'\b\d{1,4}\b'
+NUMBER_RE = re.compile(NUMBER)
+TRAILING_NUMBER_RE = re.compile(r'\b\d{1,4}\Z')
+
+
+def literal_prefix(pattern: str) -> str:
+    """The literal word every match of a pattern starts with ('violent' for r'violent\\s+crime[s]?')."""
+    match = re.match(r'[a-z]+', pattern)
+    prefix = match.group() if match else ''
+    if prefix and pattern[len(prefix):len(prefix) + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]
+    if not prefix:
+        raise ValueError(f"Pattern must start with a literal word: {pattern!r}")
+    return prefix
+
+
+class CrimeStatisticsScanner:
+    """
+    Single-pass crime statistics extractor for police report text.
+
+    Every crime-type and labelled-value pattern starts with a literal word.
+    Those words and standalone numbers are compiled into one alternation.
+    The text is tokenized once into number and label events, and each label
+    event is confirmed with an anchored match of its own pattern. Counts are
+    then resolved from the event stream: the first plausible number around
+    each crime label, and the first match of each labelled-value pattern.
+    Results are identical to running every pattern over the text on its
+    own, including labels that run into each other in extracted PDF text.
+    """
+
+    def __init__(self, crime_patterns: Dict[str, List[str]], value_patterns: List = None):
+        """
+        Args:
+            crime_patterns (Dict[str, List[str]]): Label patterns per crime type
+            value_patterns (List): (field, patterns, (low, high)) entries; defaults to VALUE_PATTERNS
+        """
+        self.crime_patterns = crime_patterns
+        self.value_patterns = value_patterns if value_patterns is not None else VALUE_PATTERNS
+
+        # (kind, key, compiled pattern): key is the crime type, or (field, pattern index)
+        self.rules: List[Tuple[str, object, re.Pattern]] = []
+        by_word: Dict[str, List[int]] = {}
+        for crime_type, patterns in self.crime_patterns.items():
+            for pattern in patterns:
+                by_word.setdefault(literal_prefix(pattern), []).append(len(self.rules))
+                self.rules.append(('crime', crime_type, re.compile(pattern, re.IGNORECASE)))
+        for field, patterns, _ in self.value_patterns:
+            for index, pattern in enumerate(patterns):
+                by_word.setdefault(literal_prefix(pattern), []).append(len(self.rules))
+                self.rules.append(('value', (field, index), re.compile(pattern, re.IGNORECASE)))
+
+        # Longest word first; a longer word also starts every shorter word it begins with.
+        # Label words sit in a lookahead so overlapping labels ("homicidesolved") are all seen.
+        words = sorted(by_word, key=len, reverse=True)
+        self.word_rules = {
+            word: [(rule, self.rules[rule][2], self.rules[rule][0] == 'crime')
+                   for other in words if word.startswith(other) for rule in by_word[other]]
+            for word in words
+        }
+        scanner = '(?=(' + '|'.join(re.escape(word) for word in words) + f'))|{NUMBER}'
+        self.pattern = re.compile(scanner)
+        self.folding_pattern = re.compile(scanner, re.IGNORECASE)
+
+    def tokenize(self, text: str) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int, int]]]:
+        """
+        Scan text once into events.
+
+        Args:
+            text (str): Lower-cased report text
+
+        Returns:
+            Tuple[List[Tuple[int, int, int]], List[Tuple[int, int, int]]]: Number events as
+            (start, end, value) and confirmed label events as (rule index, start, end)
+        """
+        numbers, labels = [], []
+        word_rules = self.word_rules
+        # Each pattern's matches must not overlap, exactly as with re.finditer
+        resume = [0] * len(self.rules)
+
+        folded = any(letter in text for letter in FOLDED_LETTERS)
+        for match in (self.folding_pattern if folded else self.pattern).finditer(text):
+            word = match.group(1)
+            if word is None:
+                numbers.append((match.start(), match.end(), int(match.group())))
+                continue
+            position = match.start()
+            for rule, regex, is_crime in word_rules[word.translate(UNFOLD) if folded else word]:
+                if position < resume[rule]:
+                    continue
+                hit = regex.match(text, position)
+                if hit:
+                    # Only the first match of a labelled-value pattern counts
+                    resume[rule] = hit.end() if is_crime else len(text) + 1
+                    labels.append((rule, position, hit.end()))
+        return numbers, labels
+
+    @staticmethod
+    def context_number(text: str, numbers: List[Tuple[int, int, int]], starts: List[int],
+                       start: int, end: int) -> Optional[int]:
+        """
+        First number in 1..2000 a regex scan of text[start:end] would find.
+
+        Numbers wholly inside the window come from the token stream. A window
+        edge can cut a longer digit run, or the word character next to a
+        number, and turn it into a number. Those are checked on a few
+        characters at each edge.
+        """
+        # str.isdecimal() is exactly \d, so most windows skip the edge regexes
+        if text[start].isdecimal():
+            head = NUMBER_RE.match(text[start:min(end, start + 5)])
+            if head and 1 <= int(head.group()) <= 2000:
+                return int(head.group())
+
+        index = bisect_right(starts, start)
+        while index < len(numbers) and numbers[index][1] < end:
+            value = numbers[index][2]
+            if 1 <= value <= 2000:
+                return value
+            index += 1
+
+        if text[end - 1].isdecimal():
+            tail = TRAILING_NUMBER_RE.search(text[max(start, end - 5):end])
+            if tail and 1 <= int(tail.group()) <= 2000:
+                return int(tail.group())
+        return None
+
+    def extract(self, text: str) -> Dict:
+        """
+        Extract crime statistics in one scan.
+
+        Args:
+            text (str): Report text
+
+        Returns:
+            Dict: extracted_numbers, a count per crime type and each labelled-value field
+        """
+        text = text.lower()
+        numbers, labels = self.tokenize(text)
+        starts = [number[0] for number in numbers]
+
+        result = {'extracted_numbers': [value for _, _, value in numbers if 1 <= value <= 5000]}
+        result.update(dict.fromkeys(self.crime_patterns, 0))
+
+        first_values = {}
+        for rule, start, end in labels:
+            kind, key, _ = self.rules[rule]
+            if kind == 'value':
+                first_values[key] = int(self.rules[rule][2].match(text, start).group(1))
+                continue
+            value = self.context_number(text, numbers, starts,
+                                        max(0, start - CONTEXT_CHARS), min(len(text), end + CONTEXT_CHARS))
+            if value is not None:
+                result[key] = max(result[key], value)
+
+        for field, patterns, (low, high) in self.value_patterns:
+            result[field] = 0
+            for index in range(len(patterns)):
+                value = first_values.get((field, index))
+                if value is not None and low <= value <= high:
+                    result[field] = value
+                    break
+        return result
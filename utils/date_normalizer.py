@@ -0,0 +1,143 @@
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# strptime formats seen on Caribbean news sites, most common first
+TEXT_DATE_FORMATS = [
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%A, %B %d, %Y',
+    '%B %d, %Y %I:%M %p',
+    '%b %d, %Y %I:%M %p'
+]
+
+# Quick shape test so obvious ISO strings skip the strptime loop
+ISO_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2})?')
+WHITESPACE = re.compile(r'\s+')
+# "Posted on", "Published:" and similar labels in front of the date
+DATE_LABEL = re.compile(r'^(?:posted|published|updated)(?:\s+on)?:?\s+', re.IGNORECASE)
+
+
+class DateNormalizer:
+    """
+    Turns article dates into naive local datetimes without guessing.
+
+    A machine-readable ``<time datetime="...">`` value or ISO text is parsed
+    directly. Other text is matched against known formats, trying first the
+    format declared for its source, then the format that last worked for the
+    same source, since one outlet always prints dates the same way. A
+    learned format only speeds up parsing: a string that reads as two
+    different dates (03/05/2025) resolves by the declared format or else by
+    format order, never by which dates happened to arrive first. Results are
+    memoized per distinct string, and a date that cannot be read yields None
+    instead of an invented timestamp.
+    """
+
+    def __init__(self, formats: Optional[List[str]] = None, max_memo: int = 4096,
+                 declared_formats: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            formats (Optional[List[str]]): strptime formats to try for text dates
+            max_memo (int): Cap on memoized date strings
+            declared_formats (Optional[Dict[str, str]]): strptime format per source id,
+                used first and to settle day/month ambiguity for that source
+        """
+        self.formats = formats or TEXT_DATE_FORMATS
+        self.max_memo = max_memo
+        self.declared_formats = declared_formats or {}
+        self.source_formats: Dict[str, str] = {}
+        # Day/month-swapped partner of each format that has one, e.g. %d/%m/%Y <-> %m/%d/%Y
+        self._swapped = {}
+        for fmt in self.formats:
+            swapped = fmt.replace('%d', '\x00').replace('%m', '%d').replace('\x00', '%m')
+            if swapped != fmt and swapped in self.formats:
+                self._swapped[fmt] = swapped
+        self._memo: Dict[str, Optional[datetime]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_iso(value: str) -> Optional[datetime]:
+        """Parse an ISO 8601 value, converting aware times to naive local time."""
+        value = value.strip()
+        if not ISO_PREFIX.match(value):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
+    def _ambiguous(self, text: str, fmt: str, parsed: datetime) -> bool:
+        """Whether text also reads as a different date with day and month swapped."""
+        swapped = self._swapped.get(fmt)
+        if not swapped:
+            return False
+        try:
+            return datetime.strptime(text, swapped) != parsed
+        except ValueError:
+            return False
+
+    def _parse_text(self, text: str, source_id: Optional[str]) -> Optional[datetime]:
+        declared = self.declared_formats.get(source_id)
+        preferred = self.source_formats.get(source_id)
+        for fmt in (declared, preferred):
+            if not fmt:
+                continue
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            if fmt == declared or not self._ambiguous(text, fmt, parsed):
+                return parsed
+
+        for fmt in self.formats:
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            # Only an unambiguous parse says anything about how the source writes dates
+            if source_id and not self._ambiguous(text, fmt, parsed):
+                self.source_formats[source_id] = fmt
+            return parsed
+        return None
+
+    def normalize(self, text: Optional[str], source_id: Optional[str] = None,
+                  machine_value: Optional[str] = None) -> Optional[datetime]:
+        """
+        Normalize an article date.
+
+        Args:
+            text (Optional[str]): Human-readable date text
+            source_id (Optional[str]): Source the date came from, for format sniffing
+            machine_value (Optional[str]): ``datetime`` attribute of a <time> element
+
+        Returns:
+            Optional[datetime]: Naive local datetime, or None if the date is unknown
+        """
+        if machine_value:
+            parsed = self.parse_iso(machine_value)
+            if parsed:
+                return parsed
+
+        text = DATE_LABEL.sub('', WHITESPACE.sub(' ', text or '').strip())
+        if not text:
+            return None
+
+        key = f'{source_id}\x00{text}'
+        if key in self._memo:
+            return self._memo[key]
+
+        parsed = self.parse_iso(text) or self._parse_text(text, source_id)
+        with self._lock:
+            if len(self._memo) >= self.max_memo:
+                self._memo.clear()
+            self._memo[key] = parsed
+        return parsed
@@ -0,0 +1,177 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+
+# Above every complemented character, so a shorter id sorts after its extensions
+ID_SENTINEL = chr(0x10FFFF)
+
+
+def order_key(timestamp: str, incident_id: str) -> Tuple[str, str]:
+    """
+    Sort key whose descending order is the feed order: most recent first,
+    ties broken by ascending id (the same order the SQL queries use).
+    """
+    inverted = ''.join(chr(0x10FFFF - ord(c)) for c in incident_id)
+    return timestamp, inverted + ID_SENTINEL
+
+
+class FacetIndex:
+    """
+    In-memory secondary indexes over the incident store for the live feed.
+
+    Every incident is kept under one sorted posting list per facet value
+    (severity, location, type), in feed order. A filter combination walks the
+    shortest matching posting lists once, checking the other facets per row,
+    which yields the page, the total and the facet counts together; the
+    result is reused until the store changes. Facet counts are disjunctive:
+    each facet is counted with every filter applied except its own, so the
+    counts show what picking another value of that facet would return. The index follows the store's
+    change sequence, so writes from any worker are applied incrementally and
+    only a deletion forces a reload.
+    """
+
+    def __init__(self, store, columns: Tuple[str, ...], max_cached: int = 64):
+        """
+        Args:
+            store: IncidentStore to index
+            columns (Tuple[str, ...]): Facet columns
+            max_cached (int): Filter combinations whose matches are kept between changes
+        """
+        self.store = store
+        self.columns = columns
+        self.max_cached = max_cached
+        self.rows: Dict[str, Tuple[Tuple[str, str], tuple, Dict]] = {}   # id -> (key, facet values, incident)
+        self.ordered: List[Tuple[str, str]] = []
+        self.postings: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self.by_key: Dict[Tuple[str, str], str] = {}
+        self.seq = None
+        self.deletions = None
+        self._matches: Dict[tuple, Tuple[List[Tuple[str, str]], Dict[str, Dict[str, int]]]] = {}
+        self._lock = threading.RLock()
+
+    def _add(self, incident: Dict) -> None:
+        self._remove(incident['id'])
+        key = order_key(incident['timestamp'], incident['id'])
+        values = tuple(incident.get(column) for column in self.columns)
+        self.rows[incident['id']] = (key, values, incident)
+        self.by_key[key] = incident['id']
+        insort(self.ordered, key)
+        for column, value in zip(self.columns, values):
+            insort(self.postings.setdefault((column, value), []), key)
+
+    def _remove(self, incident_id: str) -> None:
+        row = self.rows.pop(incident_id, None)
+        if row is None:
+            return
+        key, values, _ = row
+        del self.by_key[key]
+        self.ordered.pop(bisect_left(self.ordered, key))
+        for column, value in zip(self.columns, values):
+            posting = self.postings[(column, value)]
+            posting.pop(bisect_left(posting, key))
+            if not posting:
+                del self.postings[(column, value)]
+
+    def _reload(self) -> None:
+        self.rows, self.ordered, self.postings, self.by_key = {}, [], {}, {}
+        self.seq = -1
+        self._catch_up()
+
+    def _catch_up(self, batch: int = 1000) -> None:
+        while True:
+            changes = self.store.changes_since(self.seq, limit=batch)
+            for seq, incident in changes:
+                self._add(incident)
+                self.seq = seq
+            if len(changes) < batch:
+                return
+
+    def refresh(self) -> None:
+        """Apply store changes made since the last refresh, by this or any other worker."""
+        with self._lock:
+            seq, deletions = self.store.change_marks()
+            if deletions != self.deletions:
+                self.deletions = deletions
+                self._reload()
+            elif seq != self.seq:
+                self._catch_up()
+            else:
+                return
+            self._matches = {}
+
+    def _match(self, active: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], Dict[str, Dict[str, int]]]:
+        cache_key = tuple(active)
+        if cache_key in self._matches:
+            return self._matches[cache_key]
+
+        if not active:
+            matches = self.ordered
+            facets = {column: {} for column in self.columns}
+            for (column, value), posting in self.postings.items():
+                facets[column][value] = len(posting)
+        else:
+            checks = [(self.columns.index(column), value) for column, value in active]
+            postings = sorted((self.postings.get(pair, []) for pair in active), key=len)
+            counters = [Counter() for _ in self.columns]
+            counted = range(len(self.columns))
+            if len(active) == 1:
+                # With no other filter, the filtered facet counts every row
+                position = checks[0][0]
+                for (column, value), posting in self.postings.items():
+                    if column == active[0][0]:
+                        counters[position][value] = len(posting)
+                counted = [index for index in counted if index != position]
+                candidates = postings[0]
+            else:
+                # A row failing at most one filter is in one of the two shortest posting lists
+                candidates = (key for key, _ in groupby(heapq.merge(postings[0], postings[1])))
+
+            matches = []
+            for key in candidates:
+                values = self.rows[self.by_key[key]][1]
+                failed = [position for position, value in checks if values[position] != value]
+                if not failed:
+                    matches.append(key)
+                    for index in counted:
+                        counters[index][values[index]] += 1
+                elif len(failed) == 1:
+                    # Counts toward the one facet whose own filter it fails
+                    counters[failed[0]][values[failed[0]]] += 1
+            facets = {column: dict(counter) for column, counter in zip(self.columns, counters)}
+
+        if len(self._matches) >= self.max_cached:
+            self._matches.clear()
+        self._matches[cache_key] = (matches, facets)
+        return matches, facets
+
+    def query(self, filters: Optional[Dict[str, str]] = None, limit: int = 10, offset: int = 0,
+              after: Optional[Tuple[str, str]] = None) -> Tuple[List[Dict], int, Dict[str, Dict[str, int]]]:
+        """
+        Filter, sort (most recent first) and paginate incidents from the indexes.
+
+        Args:
+            filters (Optional[Dict[str, str]]): Values for the facet columns; 'all' disables a filter
+            limit (int): Page size
+            offset (int): Rows to skip (offset pagination)
+            after (Optional[Tuple[str, str]]): (timestamp, id) of the last row already seen
+
+        Returns:
+            Tuple[List[Dict], int, Dict[str, Dict[str, int]]]: Page of incidents, total
+            matching count and per-facet value counts, each facet counted with
+            every filter except its own
+        """
+        self.refresh()
+        filters = filters or {}
+        active = [(column, filters[column]) for column in self.columns
+                  if filters.get(column) and filters[column] != 'all']
+
+        with self._lock:
+            matches, facets = self._match(active)
+            # Matches are in ascending key order, so the feed reads them from the end
+            end = bisect_left(matches, order_key(*after)) if after is not None else len(matches) - offset
+            start = max(0, end - limit)
+            page = [self.rows[self.by_key[key]][2] for key in reversed(matches[start:max(0, end)])]
+            return page, len(matches), facets
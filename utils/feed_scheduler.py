@@ -0,0 +1,237 @@
+import os
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development server
+    fcntl = None
+
+
+class FeedRefreshScheduler:
+    """
+    Background refresh scheduler for the SECURO live crime feed.
+    Owns all news source scraping so that API requests only ever read the
+    aggregator's last good snapshot.
+
+    Every worker runs a scheduler thread, but only the one holding an
+    exclusive file lock (the leader) scrapes. The others stay idle and take
+    over when the leader's process exits and the OS releases the lock.
+    """
+
+    def __init__(self, aggregator, stale_after: int = 600, tick: float = 5.0,
+                 lock_path: Optional[str] = None):
+        """
+        Args:
+            aggregator: Feed aggregator exposing ``sources``, ``refresh_sources``,
+                ``build_snapshot``, ``get_snapshot``, ``load_shared_state`` (called
+                on becoming leader) and a shared ``store``
+            stale_after (int): Snapshot age in seconds after which readers
+                trigger an early revalidation
+            tick (float): Maximum sleep between due-source checks in seconds
+            lock_path (Optional[str]): Leader election lock file; without one
+                (or without fcntl) this process always leads
+        """
+        self.aggregator = aggregator
+        self.stale_after = stale_after
+        self.tick = tick
+        self.lock_path = lock_path
+        self.is_leader = False
+        self._lock_file = None
+
+        self.last_attempt: Dict[str, float] = {}
+        self.refresh_count = 0
+        self.last_run: Optional[datetime] = None
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._force = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the scheduler thread if it is not already running."""
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='feed-refresh-scheduler', daemon=True)
+        self._thread.start()
+        self.logger.info("Feed refresh scheduler started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler thread and give up leadership."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+        self.release_leadership()
+
+    def request_refresh(self) -> None:
+        """
+        Ask the leader to refresh every enabled source on its next pass.
+        Never blocks the caller, which makes it safe to call from request handlers.
+        """
+        if self.is_leader:
+            self._force = True
+            self._wake.set()
+        else:
+            self.aggregator.store.request_refresh()
+
+    def try_lead(self) -> bool:
+        """
+        Try to become the refresh leader with a non-blocking exclusive file lock.
+
+        Returns:
+            bool: True if this process is the leader
+        """
+        if self.is_leader:
+            return True
+
+        if not self.lock_path or fcntl is None:
+            self.is_leader = True
+            self.aggregator.load_shared_state()
+            return True
+
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+
+        self._lock_file = lock_file
+        self.is_leader = True
+        self.logger.info(f"Process {os.getpid()} is now the feed refresh leader")
+        # A previous leader may have merged incidents since this process last looked
+        self.aggregator.load_shared_state()
+        return True
+
+    def release_leadership(self) -> None:
+        if self._lock_file:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+        self.is_leader = False
+
+    def snapshot_age(self, snapshot: Optional[Dict]) -> Optional[float]:
+        """
+        Age of a snapshot in seconds.
+
+        Args:
+            snapshot (Optional[Dict]): Snapshot produced by the aggregator
+
+        Returns:
+            Optional[float]: Seconds since the snapshot was built, or None
+        """
+        if not snapshot:
+            return None
+        return max(0.0, (datetime.now() - snapshot['generated_at']).total_seconds())
+
+    def is_stale(self, snapshot: Optional[Dict]) -> bool:
+        age = self.snapshot_age(snapshot)
+        return age is None or age > self.stale_after
+
+    def due_sources(self, now: float, force: bool = False) -> list:
+        """
+        List enabled sources whose refresh interval has elapsed.
+
+        Args:
+            now (float): Current monotonic time
+            force (bool): Treat every enabled source as due
+
+        Returns:
+            list: Source ids to refresh
+        """
+        due = []
+        for source_id, source in self.aggregator.sources.items():
+            if not source.get('enabled', True):
+                continue
+            last = self.last_attempt.get(source_id)
+            if force or last is None or now - last >= source['refresh_interval']:
+                due.append(source_id)
+        return due
+
+    def run_once(self, force: bool = False) -> list:
+        """
+        Refresh all due sources and rebuild the snapshot if anything ran.
+
+        Args:
+            force (bool): Refresh every enabled source regardless of interval
+
+        Returns:
+            list: Source ids that were refreshed
+        """
+        now = time.monotonic()
+        due = self.due_sources(now, force)
+
+        for source_id in due:
+            self.last_attempt[source_id] = now
+
+        if due:
+            try:
+                # Due sources are fetched concurrently under the aggregator's overall deadline
+                self.aggregator.refresh_sources(due)
+            except Exception as e:
+                self.logger.error(f"Scheduled refresh of {', '.join(due)} failed: {str(e)}")
+
+        if due or self.aggregator.get_snapshot() is None:
+            self.aggregator.build_snapshot()
+            self.refresh_count += 1
+            self.last_run = datetime.now()
+
+        return due
+
+    def seconds_until_next_due(self) -> float:
+        now = time.monotonic()
+        waits = [self.tick]
+        for source_id, source in self.aggregator.sources.items():
+            if not source.get('enabled', True):
+                continue
+            last = self.last_attempt.get(source_id)
+            if last is None:
+                return 0.0
+            waits.append(source['refresh_interval'] - (now - last))
+        return max(0.0, min(waits))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.try_lead():
+                    # Follower: readers use the leader's shared snapshot
+                    self._stop.wait(self.tick)
+                    continue
+
+                force, self._force = self._force, False
+                force = self.aggregator.store.take_refresh_request() or force
+                self.run_once(force=force)
+            except Exception as e:
+                self.logger.error(f"Feed refresh scheduler error: {str(e)}")
+
+            self._wake.wait(self.seconds_until_next_due())
+            self._wake.clear()
+
+    def status(self) -> Dict:
+        """Scheduler state for status endpoints."""
+        return {
+            'running': self.running,
+            'is_leader': self.is_leader,
+            'pid': os.getpid(),
+            'stale_after_seconds': self.stale_after,
+            'refresh_count': self.refresh_count,
+            'last_run': self.last_run.isoformat() if self.last_run else None
+        }
@@ -0,0 +1,148 @@
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict
+
+# Response key -> incident data_type
+DATA_TYPE_KEYS = {
+    'real_news': 'real_news',
+    'trend_based': 'trend_based',
+    'simulated': 'simulated_fallback'
+}
+
+
+class FeedStats:
+    """
+    Incrementally maintained live feed statistics.
+
+    SQLite triggers on the incidents table keep a counter per statistic and a
+    count of incidents per hour of their timestamp, so every worker sees the
+    same numbers as rows are inserted, changed or deleted. The active and
+    per data_type counters only count rows flagged ``live``, the incidents of
+    the most recently published snapshot, so history kept for the archive
+    and reloaded after a restart does not inflate them; an incident stops
+    counting when a refresh no longer lists it. Reading the stats never
+    scans the incidents: the counters are read directly and the 24h window
+    sums at most a day's worth of hourly buckets, plus an index range count
+    for the partial hour at the window's start.
+    """
+
+    # Bumped when the counters change meaning, so the first worker rebuilds them
+    VERSION = 2
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feed_stats (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS feed_stats_hourly (
+            hour TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        );
+        DROP TRIGGER IF EXISTS incidents_stats_insert;
+        DROP TRIGGER IF EXISTS incidents_stats_delete;
+        DROP TRIGGER IF EXISTS incidents_stats_update;
+        CREATE TRIGGER IF NOT EXISTS incidents_live_stats_insert AFTER INSERT ON incidents
+        BEGIN
+            INSERT INTO feed_stats (key, value) VALUES ('active', 0) ON CONFLICT(key) DO NOTHING;
+            UPDATE feed_stats SET value = value + 1
+                WHERE key = 'active' AND NEW.live = 1 AND NEW.status IN ('Active', 'Reported');
+            INSERT INTO feed_stats (key, value) VALUES ('data_type:' || COALESCE(NEW.data_type, ''), NEW.live)
+                ON CONFLICT(key) DO UPDATE SET value = value + NEW.live;
+            INSERT INTO feed_stats_hourly (hour, count) VALUES (substr(NEW.timestamp, 1, 13), 1)
+                ON CONFLICT(hour) DO UPDATE SET count = count + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS incidents_live_stats_delete AFTER DELETE ON incidents
+        BEGIN
+            UPDATE feed_stats SET value = value - 1
+                WHERE key = 'active' AND OLD.live = 1 AND OLD.status IN ('Active', 'Reported');
+            UPDATE feed_stats SET value = value - OLD.live WHERE key = 'data_type:' || COALESCE(OLD.data_type, '');
+            UPDATE feed_stats_hourly SET count = count - 1 WHERE hour = substr(OLD.timestamp, 1, 13);
+            DELETE FROM feed_stats_hourly WHERE hour = substr(OLD.timestamp, 1, 13) AND count = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS incidents_live_stats_update
+            AFTER UPDATE OF status, data_type, timestamp, live ON incidents
+        BEGIN
+            UPDATE feed_stats SET value = value - 1
+                WHERE key = 'active' AND OLD.live = 1 AND OLD.status IN ('Active', 'Reported');
+            UPDATE feed_stats SET value = value + 1
+                WHERE key = 'active' AND NEW.live = 1 AND NEW.status IN ('Active', 'Reported');
+            UPDATE feed_stats SET value = value - OLD.live WHERE key = 'data_type:' || COALESCE(OLD.data_type, '');
+            INSERT INTO feed_stats (key, value) VALUES ('data_type:' || COALESCE(NEW.data_type, ''), NEW.live)
+                ON CONFLICT(key) DO UPDATE SET value = value + NEW.live;
+            UPDATE feed_stats_hourly SET count = count - 1 WHERE hour = substr(OLD.timestamp, 1, 13);
+            DELETE FROM feed_stats_hourly WHERE hour = substr(OLD.timestamp, 1, 13) AND count = 0;
+            INSERT INTO feed_stats_hourly (hour, count) VALUES (substr(NEW.timestamp, 1, 13), 1)
+                ON CONFLICT(hour) DO UPDATE SET count = count + 1;
+        END;
+    """
+
+    def __init__(self, store):
+        """
+        Args:
+            store: IncidentStore whose incidents table is counted
+        """
+        self.store = store
+
+    def install(self, conn: sqlite3.Connection) -> None:
+        """
+        Create the counter tables and triggers. The first worker to run this
+        against an existing database, or one counted by an older VERSION,
+        backfills the counters from its rows.
+        Must run inside the schema transaction.
+        """
+        conn.executescript(self.SCHEMA)
+        conn.execute("INSERT OR IGNORE INTO feed_meta (key, value) VALUES ('stats_ready', 0)")
+        claimed = conn.execute(
+            "UPDATE feed_meta SET value = ? WHERE key = 'stats_ready' AND value < ?", (self.VERSION, self.VERSION)
+        ).rowcount
+        if not claimed:
+            return
+
+        conn.execute('DELETE FROM feed_stats')
+        conn.execute('DELETE FROM feed_stats_hourly')
+        conn.execute("""
+            INSERT INTO feed_stats (key, value)
+            SELECT 'active', COUNT(*) FROM incidents WHERE live = 1 AND status IN ('Active', 'Reported')
+        """)
+        conn.execute("""
+            INSERT INTO feed_stats (key, value)
+            SELECT 'data_type:' || COALESCE(data_type, ''), SUM(live) FROM incidents GROUP BY data_type
+        """)
+        conn.execute("""
+            INSERT INTO feed_stats_hourly (hour, count)
+            SELECT substr(timestamp, 1, 13), COUNT(*) FROM incidents GROUP BY substr(timestamp, 1, 13)
+        """)
+
+    def snapshot(self, now: datetime = None) -> Dict:
+        """
+        Current statistics.
+
+        Args:
+            now (datetime): Reference time for the 24h window
+
+        Returns:
+            Dict: active and per data_type counts of the live incidents, and
+            incidents published in the last 24h
+        """
+        conn = self.store.conn
+        counters = dict(conn.execute('SELECT key, value FROM feed_stats'))
+
+        since = (now or datetime.now()) - timedelta(hours=24)
+        since_iso = since.isoformat()
+        since_hour = since_iso[:13]
+
+        # Whole hours after the window start, then the part of the first hour inside it
+        whole_hours = conn.execute(
+            'SELECT COALESCE(SUM(count), 0) FROM feed_stats_hourly WHERE hour > ?', (since_hour,)
+        ).fetchone()[0]
+        first_hour = conn.execute(
+            'SELECT COUNT(*) FROM incidents WHERE timestamp > ? AND timestamp < ?', (since_iso, since_hour + '~')
+        ).fetchone()[0]
+
+        stats = {
+            'active_incidents': counters.get('active', 0),
+            'recent_24h': whole_hours + first_hour
+        }
+        for key, data_type in DATA_TYPE_KEYS.items():
+            stats[key] = counters.get(f'data_type:{data_type}', 0)
+        return stats
@@ -0,0 +1,254 @@
+import time
+import random
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class SourceUnavailableError(Exception):
+    """Raised instead of a network call when a host may not be contacted right now."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often one host is requested.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available, without taking one."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self.tokens) / self.rate)
+
+    def acquire(self, timeout: float) -> bool:
+        """
+        Take one token, sleeping until one is available or the timeout passes.
+
+        Args:
+            timeout (float): Longest wait in seconds
+
+        Returns:
+            bool: True if a token was taken
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for one host.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every call fails fast. Once the backoff delay passes a single probe is let
+    through (half-open): success closes the circuit, failure reopens it with
+    a doubled, jittered delay.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    # How long callers should wait while a half-open probe is running
+    PROBE_WAIT = 1.0
+
+    def __init__(self, failure_threshold: int = 3, base_delay: float = 30.0,
+                 max_delay: float = 1800.0, jitter: float = 0.2):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            base_delay (float): First open period in seconds
+            max_delay (float): Upper bound for the open period in seconds
+            jitter (float): Random +/- fraction applied to each open period
+        """
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.open_count = 0
+        self.opened_until: Optional[datetime] = None
+        self.last_failure: Optional[str] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now; claims the probe slot when half-open."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if datetime.now() < self.opened_until:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+
+            return True
+
+    def retry_in(self) -> float:
+        """Seconds until ``allow_request`` could pass, 0 if it may pass now."""
+        with self._lock:
+            if self.state == self.OPEN:
+                return max(0.0, (self.opened_until - datetime.now()).total_seconds())
+            if self.state == self.HALF_OPEN and self._probe_in_flight:
+                return self.PROBE_WAIT
+            return 0.0
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.open_count = 0
+            self.opened_until = None
+            self._probe_in_flight = False
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_failure = error
+            self._probe_in_flight = False
+
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.open_count += 1
+                delay = min(self.max_delay, self.base_delay * 2 ** (self.open_count - 1))
+                delay *= 1 + random.uniform(-self.jitter, self.jitter)
+                self.state = self.OPEN
+                self.opened_until = datetime.now() + timedelta(seconds=delay)
+
+    def status(self) -> Dict:
+        """JSON-serializable breaker state for status endpoints."""
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'open_count': self.open_count,
+                'retry_at': self.opened_until.isoformat() if self.state == self.OPEN else None,
+                'last_failure': self.last_failure
+            }
+
+
+class HostGuard:
+    """
+    Per-host politeness for the live feed scrapers: one token bucket and one
+    circuit breaker per hostname, shared by every source on that host.
+    """
+
+    def __init__(self, rate: float = 0.5, burst: int = 2, failure_threshold: int = 3,
+                 base_delay: float = 30.0, max_delay: float = 1800.0):
+        """
+        Args:
+            rate (float): Requests per second allowed per host
+            burst (int): Requests allowed back to back per host
+            failure_threshold (int): Consecutive failures that open a host's circuit
+            base_delay (float): First open period in seconds
+            max_delay (float): Upper bound for the open period in seconds
+        """
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).hostname or url
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = self.host(url)
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.base_delay, self.max_delay)
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.breakers[host]
+
+    def before_request(self, url: str, timeout: float) -> None:
+        """
+        Gate an outgoing request: fail fast on an open circuit, then wait for a token.
+
+        Args:
+            url (str): URL about to be requested
+            timeout (float): Longest wait for a rate-limit token in seconds
+
+        Raises:
+            SourceUnavailableError: If the circuit is open or no token came in time
+        """
+        host = self.host(url)
+        breaker = self.breaker(url)
+
+        if not breaker.allow_request():
+            status = breaker.status()
+            retry = f"until {status['retry_at']}" if status['retry_at'] else 'while a probe is running'
+            raise SourceUnavailableError(f"Circuit open for {host} {retry}")
+
+        if not self.buckets[host].acquire(timeout):
+            # Nothing was sent to the host, so give the probe slot back
+            breaker.release_probe()
+            raise SourceUnavailableError(f"Rate limit for {host} not available within {timeout:.1f}s")
+
+    def wait_time(self, url: str) -> float:
+        """
+        Seconds until a request to the URL's host would pass ``before_request`` without waiting.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: 0 if the host may be contacted now
+        """
+        breaker = self.breaker(url)
+        return max(breaker.retry_in(), self.buckets[self.host(url)].wait_time())
+
+    def record_success(self, url: str) -> None:
+        self.breaker(url).record_success()
+
+    def record_failure(self, url: str, error: str) -> None:
+        breaker = self.breaker(url)
+        was_open = breaker.state == CircuitBreaker.OPEN
+        breaker.record_failure(error)
+        if breaker.state == CircuitBreaker.OPEN and not was_open:
+            self.logger.warning(f"Circuit opened for {self.host(url)}: {error}")
+
+    def status(self, url: str) -> Dict:
+        return self.breaker(url).status()
@@ -0,0 +1,335 @@
+import json
+import time
+import zlib
+import heapq
+import logging
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.facet_index import order_key
+
+# Low-cardinality columns stored dictionary-encoded, so filters compare small ints
+ENCODED_COLUMNS = ('severity', 'location', 'type', 'status', 'data_type')
+
+
+def month_of(timestamp: str) -> str:
+    return timestamp[:7]
+
+
+def shift_month(month: str, months: int) -> str:
+    """'YYYY-MM' moved by a number of calendar months."""
+    index = int(month[:4]) * 12 + int(month[5:7]) - 1 + months
+    return f'{index // 12:04d}-{index % 12 + 1:02d}'
+
+
+def encode_partition(incidents: List[Dict]) -> bytes:
+    """
+    Columnar, zlib-compressed encoding of one month of incidents, in feed order.
+
+    Args:
+        incidents (List[Dict]): Incidents of a single month
+
+    Returns:
+        bytes: Compressed partition
+    """
+    incidents = sorted(incidents, key=lambda i: order_key(i['timestamp'], i['id']), reverse=True)
+    columns = {
+        'id': [incident['id'] for incident in incidents],
+        'timestamp': [incident['timestamp'] for incident in incidents]
+    }
+    for column in ENCODED_COLUMNS:
+        values, codes = {}, []
+        for incident in incidents:
+            codes.append(values.setdefault(incident.get(column), len(values)))
+        columns[column] = {'values': list(values), 'codes': codes}
+
+    data = {'columns': columns, 'payloads': incidents}
+    return zlib.compress(json.dumps(data, sort_keys=True, separators=(',', ':')).encode(), 6)
+
+
+def decode_partition(blob: bytes) -> Dict:
+    return json.loads(zlib.decompress(blob))
+
+
+class IncidentArchive:
+    """
+    Tiered history for the incident store.
+
+    The incidents table stays the hot partition the live feed reads. Real
+    news older than ``hot_days`` is compacted one calendar month at a time
+    into a columnar, compressed partition row in the same database, and
+    partitions older than the retention period are dropped. Range queries
+    read the hot rows in range and only the monthly partitions that overlap
+    the range, merged as one stream in feed order.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS archive_partitions (
+            month TEXT PRIMARY KEY,
+            rows INTEGER NOT NULL,
+            min_timestamp TEXT NOT NULL,
+            max_timestamp TEXT NOT NULL,
+            raw_bytes INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            compacted_at TEXT NOT NULL
+        );
+        INSERT OR IGNORE INTO feed_meta (key, value) VALUES ('archive_compacted_at', 0);
+    """
+
+    def __init__(self, store, hot_days: int = 90, retention_months: int = 0,
+                 interval: int = 21600, max_cached: int = 12):
+        """
+        Args:
+            store: IncidentStore holding the hot partition
+            hot_days (int): Days of history kept in the hot partition
+            retention_months (int): Months of archived history to keep; 0 keeps everything
+            interval (int): Minimum seconds between compaction runs across all workers
+            max_cached (int): Decoded partitions kept in memory
+        """
+        self.store = store
+        self.hot_days = hot_days
+        self.retention_months = retention_months
+        self.interval = interval
+        self.max_cached = max_cached
+        self._cache: 'OrderedDict[str, Tuple[str, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        with store.conn:
+            store.conn.executescript(self.SCHEMA)
+
+    def hot_cutoff(self, now: Optional[datetime] = None) -> str:
+        """First month that stays in the hot partition."""
+        return month_of(((now or datetime.now()) - timedelta(days=self.hot_days)).isoformat())
+
+    def maybe_compact(self, now: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Compact and apply retention if no worker has done so within ``interval``.
+
+        Returns:
+            Optional[Dict]: Compaction summary, or None if it was not this worker's turn
+        """
+        started = int(time.time())
+        with self.store.conn:
+            claimed = self.store.conn.execute(
+                "UPDATE feed_meta SET value = ? WHERE key = 'archive_compacted_at' AND value <= ?",
+                (started, started - self.interval)
+            ).rowcount
+        if not claimed:
+            return None
+        return self.compact(now)
+
+    def compact(self, now: Optional[datetime] = None) -> Dict:
+        """
+        Move real news older than the hot window into monthly partitions and
+        drop partitions past retention. Each month moves in one transaction.
+
+        Returns:
+            Dict: Months compacted, rows moved and partitions dropped
+        """
+        conn = self.store.conn
+        cutoff = self.hot_cutoff(now)
+        months = [row[0] for row in conn.execute(
+            'SELECT DISTINCT substr(timestamp, 1, 7) FROM incidents WHERE timestamp < ? AND data_type = ?',
+            (cutoff, self.store.REAL_DATA_TYPE)
+        )]
+
+        moved = 0
+        for month in months:
+            moved += self._compact_month(month)
+
+        dropped = []
+        if self.retention_months:
+            keep_from = shift_month(month_of((now or datetime.now()).isoformat()), -self.retention_months)
+            with conn:
+                dropped = [row[0] for row in conn.execute(
+                    'SELECT month FROM archive_partitions WHERE month < ?', (keep_from,))]
+                conn.execute('DELETE FROM archive_partitions WHERE month < ?', (keep_from,))
+
+        if months or dropped:
+            self.logger.info(f"Archive: compacted {moved} incidents from {len(months)} month(s), "
+                             f"dropped {len(dropped)} expired partition(s)")
+        return {'months': months, 'moved': moved, 'dropped': dropped}
+
+    def _compact_month(self, month: str) -> int:
+        conn = self.store.conn
+        start, end = month, shift_month(month, 1)
+        with conn:
+            rows = conn.execute(
+                'SELECT payload FROM incidents WHERE timestamp >= ? AND timestamp < ? AND data_type = ?',
+                (start, end, self.store.REAL_DATA_TYPE)
+            ).fetchall()
+            if not rows:
+                return 0
+            incidents = {incident['id']: incident for incident in (json.loads(row[0]) for row in rows)}
+
+            # Late arrivals for an already compacted month are merged in; the hot copy wins
+            existing = conn.execute('SELECT data FROM archive_partitions WHERE month = ?', (month,)).fetchone()
+            if existing:
+                for incident in decode_partition(existing[0])['payloads']:
+                    incidents.setdefault(incident['id'], incident)
+
+            merged = list(incidents.values())
+            raw_bytes = sum(len(json.dumps(incident)) for incident in merged)
+            conn.execute("""
+                INSERT INTO archive_partitions (month, rows, min_timestamp, max_timestamp, raw_bytes, data, compacted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(month) DO UPDATE SET
+                    rows = excluded.rows,
+                    min_timestamp = excluded.min_timestamp,
+                    max_timestamp = excluded.max_timestamp,
+                    raw_bytes = excluded.raw_bytes,
+                    data = excluded.data,
+                    compacted_at = excluded.compacted_at
+            """, (month, len(merged), min(i['timestamp'] for i in merged), max(i['timestamp'] for i in merged),
+                  raw_bytes, encode_partition(merged), datetime.now().isoformat()))
+            conn.execute(
+                'DELETE FROM incidents WHERE timestamp >= ? AND timestamp < ? AND data_type = ?',
+                (start, end, self.store.REAL_DATA_TYPE)
+            )
+        return len(rows)
+
+    def _partition(self, month: str, compacted_at: str) -> Dict:
+        with self._lock:
+            cached = self._cache.get(month)
+            if cached and cached[0] == compacted_at:
+                self._cache.move_to_end(month)
+                return cached[1]
+
+        row = self.store.conn.execute('SELECT data FROM archive_partitions WHERE month = ?', (month,)).fetchone()
+        partition = decode_partition(row[0]) if row else {'columns': {'id': [], 'timestamp': []}, 'payloads': []}
+        with self._lock:
+            self._cache[month] = (compacted_at, partition)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return partition
+
+    def _archived_matches(self, active: List[Tuple[str, str]], start: Optional[str],
+                          end: Optional[str], scanned: List[str]):
+        where, params = [], []
+        if start:
+            where.append('max_timestamp >= ?')
+            params.append(start)
+        if end:
+            where.append('min_timestamp < ?')
+            params.append(end)
+        catalog = self.store.conn.execute(
+            'SELECT month, compacted_at FROM archive_partitions'
+            + (' WHERE ' + ' AND '.join(where) if where else '') + ' ORDER BY month DESC', params
+        ).fetchall()
+
+        # Hot copies of archived incidents (late arrivals not compacted yet) win
+        shadowed = set()
+        if catalog:
+            shadowed = {row[0] for row in self.store.conn.execute(
+                'SELECT id FROM incidents WHERE timestamp < ?', (shift_month(catalog[0][0], 1),)
+            )}
+
+        # Partitions hold disjoint months, each in feed order, so newest month first is feed order
+        for month, compacted_at in catalog:
+            scanned.append(month)
+            partition = self._partition(month, compacted_at)
+            columns = partition['columns']
+            wanted = []
+            for column, value in active:
+                values = columns[column]['values']
+                if value not in values:
+                    break
+                wanted.append((columns[column]['codes'], values.index(value)))
+            else:
+                timestamps = columns['timestamp']
+                for position, timestamp in enumerate(timestamps):
+                    if (start and timestamp < start) or (end and timestamp >= end):
+                        continue
+                    if (all(codes[position] == code for codes, code in wanted)
+                            and columns['id'][position] not in shadowed):
+                        yield partition['payloads'][position]
+
+    def iter_incidents(self, filters: Optional[Dict[str, str]] = None, start: Optional[str] = None,
+                       end: Optional[str] = None, scanned: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Every matching incident in a time range, hot and archived, most recent
+        first. The hot rows and the overlapping partitions are merged as
+        streams, so memory stays flat whatever the range.
+
+        Args:
+            filters (Optional[Dict[str, str]]): Values for severity/location/type; 'all' disables a filter
+            start (Optional[str]): Inclusive lower timestamp bound (ISO)
+            end (Optional[str]): Exclusive upper timestamp bound (ISO)
+            scanned (Optional[List[str]]): Collects the archived months that were read
+
+        Yields:
+            Dict: Incident payloads
+        """
+        filters = filters or {}
+        active = [(column, filters[column]) for column in self.store.FILTER_COLUMNS
+                  if filters.get(column) and filters[column] != 'all']
+        return heapq.merge(
+            self.store.iter_incidents(filters, start=start, end=end),
+            self._archived_matches(active, start, end, scanned if scanned is not None else []),
+            key=lambda incident: order_key(incident['timestamp'], incident['id']),
+            reverse=True
+        )
+
+    def query(self, filters: Optional[Dict[str, str]] = None, start: Optional[str] = None,
+              end: Optional[str] = None, limit: int = 10, offset: int = 0,
+              after: Optional[Tuple[str, str]] = None) -> Tuple[List[Dict], int, Dict, List[str]]:
+        """
+        Filter, sort (most recent first) and paginate incidents in a time range
+        across the hot partition and the overlapping monthly partitions.
+
+        Args:
+            filters (Optional[Dict[str, str]]): Values for severity/location/type; 'all' disables a filter
+            start (Optional[str]): Inclusive lower timestamp bound (ISO)
+            end (Optional[str]): Exclusive upper timestamp bound (ISO)
+            limit (int): Page size
+            offset (int): Rows to skip (offset pagination)
+            after (Optional[Tuple[str, str]]): (timestamp, id) of the last row already seen
+
+        Returns:
+            Tuple[List[Dict], int, Dict, List[str]]: Page of incidents, total matching
+            count, per-facet value counts (each facet counted with every filter
+            except its own) and the archived months that were read
+        """
+        filters = filters or {}
+        columns = self.store.FILTER_COLUMNS
+        filtered = [column for column in columns if filters.get(column) and filters[column] != 'all']
+        cursor = order_key(*after) if after is not None else None
+
+        page, total, scanned = [], 0, []
+        counters = {column: Counter() for column in columns}
+        for incident in self.iter_incidents(filters, start, end, scanned):
+            if cursor is not None:
+                if len(page) < limit and order_key(incident['timestamp'], incident['id']) < cursor:
+                    page.append(incident)
+            elif offset <= total < offset + limit:
+                page.append(incident)
+            total += 1
+            for column in columns:
+                if column not in filtered:
+                    counters[column][incident.get(column)] += 1
+
+        # Disjunctive counts: a filtered facet is counted without its own filter
+        for column in filtered:
+            for incident in self.iter_incidents({**filters, column: 'all'}, start, end):
+                counters[column][incident.get(column)] += 1
+
+        return page, total, {column: dict(counter) for column, counter in counters.items()}, scanned
+
+    def status(self) -> Dict:
+        row = self.store.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(rows), 0), COALESCE(SUM(raw_bytes), 0), '
+            'COALESCE(SUM(LENGTH(data)), 0), MIN(month), MAX(month) FROM archive_partitions'
+        ).fetchone()
+        return {
+            'partitions': row[0],
+            'archived_incidents': row[1],
+            'raw_bytes': row[2],
+            'compressed_bytes': row[3],
+            'oldest_month': row[4],
+            'newest_month': row[5],
+            'hot_days': self.hot_days,
+            'retention_months': self.retention_months
+        }
@@ -0,0 +1,584 @@
+import os
+import json
+import base64
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.facet_index import FacetIndex
+from utils.feed_stats import FeedStats
+
+
+def encode_cursor(position: Dict) -> str:
+    """
+    Encode a pagination or delta position as an opaque URL-safe token.
+
+    Args:
+        position (Dict): {'t': timestamp, 'i': id} for pages, {'s': seq} for deltas
+
+    Returns:
+        str: Opaque cursor
+    """
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError(f'Invalid cursor: {cursor}')
+    if not isinstance(position, dict):
+        raise ValueError(f'Invalid cursor: {cursor}')
+    return position
+
+
+class IncidentStore:
+    """
+    Persistent, deduplicated incident store for the SECURO live crime feed.
+    Backed by an embedded SQLite database in WAL mode so every gunicorn worker
+    reads the same history and survives restarts. It also holds the shared
+    feed snapshot published by the refresh leader.
+    """
+
+    REAL_DATA_TYPE = 'real_news'
+
+    FILTER_COLUMNS = ('severity', 'location', 'type')
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path (str): Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._changed = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+        self.live_stats = FeedStats(self)
+        self.facets = FacetIndex(self, self.FILTER_COLUMNS)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._create_schema()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Per-thread connection; SQLite connections must not be shared across threads."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=10000')
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self) -> None:
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS incidents (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    severity TEXT,
+                    location TEXT,
+                    type TEXT,
+                    status TEXT,
+                    data_type TEXT,
+                    source TEXT,
+                    payload TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_incidents_timestamp ON incidents (timestamp DESC, id);
+                CREATE INDEX IF NOT EXISTS idx_incidents_severity ON incidents (severity, timestamp DESC);
+                CREATE INDEX IF NOT EXISTS idx_incidents_location ON incidents (location, timestamp DESC);
+                CREATE INDEX IF NOT EXISTS idx_incidents_type ON incidents (type, timestamp DESC);
+                CREATE INDEX IF NOT EXISTS idx_incidents_data_type ON incidents (data_type);
+                CREATE TABLE IF NOT EXISTS feed_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO feed_meta (key, value) VALUES ('seq', 0);
+                INSERT OR IGNORE INTO feed_meta (key, value) VALUES ('refresh_requested', 0);
+                INSERT OR IGNORE INTO feed_meta (key, value) VALUES ('deletions', 0);
+                CREATE TABLE IF NOT EXISTS feed_snapshot (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL,
+                    generated_at TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS article_details (
+                    url TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS incident_aliases (
+                    id TEXT PRIMARY KEY,
+                    canonical_id TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_incident_aliases_canonical ON incident_aliases (canonical_id);
+            """)
+
+            columns = [row[1] for row in self.conn.execute('PRAGMA table_info(incidents)')]
+            if 'seq' not in columns:
+                self.conn.execute('ALTER TABLE incidents ADD COLUMN seq INTEGER NOT NULL DEFAULT 0')
+            # 1 for the incidents of the latest published snapshot, which the live stats count
+            if 'live' not in columns:
+                self.conn.execute('ALTER TABLE incidents ADD COLUMN live INTEGER NOT NULL DEFAULT 0')
+
+            # Every insert or payload change gets the next value of a global change
+            # sequence, so readers in any worker can ask "what changed after N?"
+            self.conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_incidents_seq ON incidents (seq);
+                CREATE TRIGGER IF NOT EXISTS incidents_seq_insert AFTER INSERT ON incidents
+                BEGIN
+                    UPDATE feed_meta SET value = value + 1 WHERE key = 'seq';
+                    UPDATE incidents SET seq = (SELECT value FROM feed_meta WHERE key = 'seq') WHERE id = NEW.id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS incidents_seq_update AFTER UPDATE OF payload ON incidents
+                BEGIN
+                    UPDATE feed_meta SET value = value + 1 WHERE key = 'seq';
+                    UPDATE incidents SET seq = (SELECT value FROM feed_meta WHERE key = 'seq') WHERE id = NEW.id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS incidents_deletions AFTER DELETE ON incidents
+                BEGIN
+                    UPDATE feed_meta SET value = value + 1 WHERE key = 'deletions';
+                END;
+            """)
+            self.live_stats.install(self.conn)
+
+    def _row(self, incident: Dict, now: str) -> tuple:
+        return (
+            incident['id'],
+            incident['timestamp'],
+            incident.get('severity'),
+            incident.get('location'),
+            incident.get('type'),
+            incident.get('status'),
+            incident.get('data_type'),
+            incident.get('source'),
+            json.dumps(incident, sort_keys=True),
+            now,
+            now
+        )
+
+    def upsert_many(self, incidents: List[Dict]) -> int:
+        """
+        Insert new incidents and update changed ones, keyed by incident id.
+
+        Args:
+            incidents (List[Dict]): Standardized incidents
+
+        Returns:
+            int: Number of rows inserted or changed
+        """
+        if not incidents:
+            return 0
+
+        with self.conn:
+            before = self.current_seq()
+            self._upsert(incidents)
+            changed = self.current_seq() - before
+        if changed:
+            self._after_write()
+        return changed
+
+    def _upsert(self, incidents: List[Dict]) -> None:
+        now = datetime.now().isoformat()
+        self.conn.executemany("""
+            INSERT INTO incidents (id, timestamp, severity, location, type, status,
+                                   data_type, source, payload, first_seen, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                timestamp = excluded.timestamp,
+                severity = excluded.severity,
+                location = excluded.location,
+                type = excluded.type,
+                status = excluded.status,
+                data_type = excluded.data_type,
+                source = excluded.source,
+                payload = excluded.payload,
+                updated_at = excluded.updated_at
+            WHERE incidents.payload != excluded.payload
+        """, [self._row(incident, now) for incident in incidents])
+
+    def replace_synthetic(self, incidents: List[Dict]) -> None:
+        """
+        Replace the set of non-news incidents (trend, supplemental, fallback) in one transaction.
+        Rows missing from the new set are deleted; unchanged rows are left untouched.
+
+        Args:
+            incidents (List[Dict]): Synthetic incidents to keep
+        """
+        keep = [incident['id'] for incident in incidents]
+        with self.conn:
+            before = self.current_seq()
+            placeholders = ','.join('?' * len(keep))
+            self.conn.execute(
+                f'DELETE FROM incidents WHERE data_type != ? AND id NOT IN ({placeholders})',
+                [self.REAL_DATA_TYPE] + keep
+            )
+            self._upsert(incidents)
+            # Whatever synthetic set is stored is what the feed shows
+            self.conn.execute(f'UPDATE incidents SET live = 1 WHERE live = 0 AND id IN ({placeholders})', keep)
+            changed = self.current_seq() - before
+        if changed:
+            self._after_write()
+
+    def _mark_live(self, ids: List[str]) -> None:
+        """Flag exactly these real incidents as the live generation; the stats triggers follow."""
+        placeholders = ','.join('?' * len(ids))
+        with self.conn:
+            self.conn.execute(
+                f'UPDATE incidents SET live = 0 WHERE live = 1 AND data_type = ? AND id NOT IN ({placeholders})',
+                [self.REAL_DATA_TYPE] + ids
+            )
+            self.conn.execute(f'UPDATE incidents SET live = 1 WHERE live = 0 AND id IN ({placeholders})', ids)
+
+    def sync(self, incidents: List[Dict]) -> int:
+        """
+        Persist a freshly built snapshot: upsert real news, replace synthetic data
+        and make the snapshot's incidents the live generation the stats count.
+
+        Args:
+            incidents (List[Dict]): All incidents in the snapshot
+
+        Returns:
+            int: Number of real incidents inserted or changed
+        """
+        real = [i for i in incidents if i.get('data_type') == self.REAL_DATA_TYPE]
+        synthetic = [i for i in incidents if i.get('data_type') != self.REAL_DATA_TYPE]
+        changed = self.upsert_many(real)
+        self.replace_synthetic(synthetic)
+        self._mark_live([i['id'] for i in real])
+        return changed
+
+    def _where(self, filters: Dict[str, str], start: Optional[str] = None,
+               end: Optional[str] = None) -> Tuple[str, list]:
+        clauses, params = [], []
+        for column in self.FILTER_COLUMNS:
+            value = filters.get(column, 'all')
+            if value and value != 'all':
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if start:
+            clauses.append('timestamp >= ?')
+            params.append(start)
+        if end:
+            clauses.append('timestamp < ?')
+            params.append(end)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, filters: Optional[Dict[str, str]] = None, limit: int = 10, offset: int = 0,
+              after: Optional[Tuple[str, str]] = None, count: bool = True,
+              start: Optional[str] = None, end: Optional[str] = None) -> Tuple[List[Dict], int]:
+        """
+        Filter, sort (most recent first) and paginate incidents using the indexes.
+
+        Args:
+            filters (Optional[Dict[str, str]]): Values for severity/location/type; 'all' disables a filter
+            limit (int): Page size
+            offset (int): Rows to skip (offset pagination)
+            after (Optional[Tuple[str, str]]): (timestamp, id) of the last row already seen
+                (keyset pagination; stable while new incidents arrive)
+            count (bool): Also count every matching row; when False the total is None
+            start (Optional[str]): Inclusive lower timestamp bound (ISO)
+            end (Optional[str]): Exclusive upper timestamp bound (ISO)
+
+        Returns:
+            Tuple[List[Dict], int]: Page of incidents and total matching count
+        """
+        where, params = self._where(filters or {}, start, end)
+        total = self.conn.execute(f'SELECT COUNT(*) FROM incidents{where}', params).fetchone()[0] if count else None
+
+        if after is not None:
+            keyset = '(timestamp < ? OR (timestamp = ? AND id > ?))'
+            where = f'{where} AND {keyset}' if where else f' WHERE {keyset}'
+            params = params + [after[0], after[0], after[1]]
+            offset = 0
+
+        rows = self.conn.execute(
+            f'SELECT payload FROM incidents{where} ORDER BY timestamp DESC, id LIMIT ? OFFSET ?',
+            params + [limit, offset]
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows], total
+
+    def iter_incidents(self, filters: Optional[Dict[str, str]] = None, batch: int = 500,
+                       start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Every matching incident, most recent first, read in keyset batches so
+        memory stays flat and no read transaction is held open between batches.
+
+        Args:
+            filters (Optional[Dict[str, str]]): Values for severity/location/type; 'all' disables a filter
+            batch (int): Rows fetched per query
+            start (Optional[str]): Inclusive lower timestamp bound (ISO)
+            end (Optional[str]): Exclusive upper timestamp bound (ISO)
+
+        Yields:
+            Dict: Incident payloads
+        """
+        after = None
+        while True:
+            rows, _ = self.query(filters, limit=batch, after=after, count=False, start=start, end=end)
+            yield from rows
+            if len(rows) < batch:
+                return
+            after = (rows[-1]['timestamp'], rows[-1]['id'])
+
+    def current_seq(self) -> int:
+        """Latest value of the change sequence."""
+        return self.conn.execute("SELECT value FROM feed_meta WHERE key = 'seq'").fetchone()[0]
+
+    def changes_since(self, seq: int, limit: int = 100,
+                      filters: Optional[Dict[str, str]] = None) -> List[Tuple[int, Dict]]:
+        """
+        Incidents inserted or updated after a change sequence value, oldest change first.
+
+        Args:
+            seq (int): Last change sequence value the caller has seen
+            limit (int): Maximum rows to return
+            filters (Optional[Dict[str, str]]): Optional severity/location/type filters
+
+        Returns:
+            List[Tuple[int, Dict]]: (seq, incident) pairs
+        """
+        where, params = self._where(filters or {})
+        where = f'{where} AND seq > ?' if where else ' WHERE seq > ?'
+        rows = self.conn.execute(
+            f'SELECT seq, payload FROM incidents{where} ORDER BY seq LIMIT ?',
+            params + [seq, limit]
+        ).fetchall()
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def change_marks(self) -> Tuple[int, int]:
+        """(change sequence, deletion count); readers caching rows reload when either moves."""
+        rows = dict(self.conn.execute("SELECT key, value FROM feed_meta WHERE key IN ('seq', 'deletions')"))
+        return rows['seq'], rows['deletions']
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    def _after_write(self) -> None:
+        # Keep this worker's facet index current once something has queried it
+        if self.facets.seq is not None:
+            self.facets.refresh()
+        self._notify()
+
+    def wait_for_change(self, seq: int, timeout: float) -> bool:
+        """
+        Block until the change sequence moves past ``seq`` or the timeout expires.
+        Writes from this process wake waiters immediately; writes from other
+        workers are picked up by the sequence check after each wait.
+
+        Args:
+            seq (int): Last change sequence value the caller has seen
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if there are changes after ``seq``
+        """
+        if self.current_seq() > seq:
+            return True
+        with self._changed:
+            self._changed.wait(timeout)
+        return self.current_seq() > seq
+
+    def save_snapshot(self, generated_at: str, snapshot: Dict) -> int:
+        """
+        Publish feed snapshot metadata for every worker, bumping the shared version.
+
+        Args:
+            generated_at (str): ISO timestamp of the snapshot
+            snapshot (Dict): JSON-serializable snapshot metadata
+
+        Returns:
+            int: New snapshot version
+        """
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO feed_snapshot (id, version, generated_at, payload) VALUES (1, 1, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    version = version + 1,
+                    generated_at = excluded.generated_at,
+                    payload = excluded.payload
+            """, (generated_at, json.dumps(snapshot)))
+            return self.conn.execute('SELECT version FROM feed_snapshot WHERE id = 1').fetchone()[0]
+
+    def snapshot_version(self) -> Optional[int]:
+        """Current shared snapshot version, or None before the first refresh."""
+        row = self.conn.execute('SELECT version FROM feed_snapshot WHERE id = 1').fetchone()
+        return row[0] if row else None
+
+    def load_snapshot(self) -> Optional[Dict]:
+        """
+        Load the shared snapshot.
+
+        Returns:
+            Optional[Dict]: Snapshot metadata with 'version' and 'generated_at', or None
+        """
+        row = self.conn.execute('SELECT version, generated_at, payload FROM feed_snapshot WHERE id = 1').fetchone()
+        if not row:
+            return None
+        snapshot = json.loads(row[2])
+        snapshot['version'] = row[0]
+        snapshot['generated_at'] = row[1]
+        return snapshot
+
+    def request_refresh(self) -> None:
+        """Flag a refresh for the refresh leader, whichever worker it is."""
+        with self.conn:
+            self.conn.execute("UPDATE feed_meta SET value = 1 WHERE key = 'refresh_requested'")
+
+    def take_refresh_request(self) -> bool:
+        """Atomically consume a pending refresh request."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE feed_meta SET value = 0 WHERE key = 'refresh_requested' AND value = 1"
+            )
+            return cursor.rowcount == 1
+
+    def new_urls(self, urls: List[str]) -> List[str]:
+        """Filter article URLs down to those never crawled, successfully or not."""
+        if not urls:
+            return []
+        placeholders = ','.join('?' * len(urls))
+        seen = {row[0] for row in self.conn.execute(
+            f'SELECT url FROM article_details WHERE url IN ({placeholders})', urls
+        )}
+        return [url for url in urls if url not in seen]
+
+    def save_detail(self, url: str, body: str, status: str = 'ok') -> None:
+        """
+        Record a crawled article page so it is never fetched again.
+
+        Args:
+            url (str): Article URL
+            body (str): Extracted story text ('' when nothing was found)
+            status (str): 'ok', 'empty' or 'error'
+        """
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO article_details (url, body, status, fetched_at) VALUES (?, ?, ?, ?)',
+                (url, body, status, datetime.now().isoformat())
+            )
+
+    def details_for(self, urls: List[str]) -> Dict[str, str]:
+        """Story text for the given article URLs that have been crawled successfully."""
+        if not urls:
+            return {}
+        placeholders = ','.join('?' * len(urls))
+        return dict(self.conn.execute(
+            f"SELECT url, body FROM article_details WHERE status = 'ok' AND url IN ({placeholders})", urls
+        ))
+
+    def merge_payload(self, incident_id: str, fields: Dict) -> bool:
+        """
+        Merge fields into a stored incident, bumping its change sequence if anything changed.
+
+        Args:
+            incident_id (str): Incident id
+            fields (Dict): Payload fields to set
+
+        Returns:
+            bool: True if the incident exists and changed
+        """
+        with self.conn:
+            row = self.conn.execute('SELECT payload FROM incidents WHERE id = ?', (incident_id,)).fetchone()
+            if not row:
+                return False
+            payload = json.loads(row[0])
+            merged = {**payload, **fields}
+            if merged == payload:
+                return False
+            self.conn.execute(
+                'UPDATE incidents SET payload = ?, updated_at = ? WHERE id = ?',
+                (json.dumps(merged, sort_keys=True), datetime.now().isoformat(), incident_id)
+            )
+        self._after_write()
+        return True
+
+    def recent_incidents(self, since: str, data_type: str = REAL_DATA_TYPE) -> List[Dict]:
+        """
+        Stored incidents of one data type published at or after a timestamp.
+
+        Args:
+            since (str): ISO timestamp lower bound
+            data_type (str): Incident data_type
+
+        Returns:
+            List[Dict]: Incident payloads, oldest first
+        """
+        rows = self.conn.execute(
+            'SELECT payload FROM incidents WHERE data_type = ? AND timestamp >= ? ORDER BY timestamp',
+            (data_type, since)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def save_aliases(self, aliases: Dict[str, str]) -> None:
+        """Persist duplicate id -> canonical id mappings decided by the deduplicator."""
+        if not aliases:
+            return
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO incident_aliases (id, canonical_id, created_at) VALUES (?, ?, ?)',
+                [(alias, canonical_id, now) for alias, canonical_id in aliases.items()]
+            )
+
+    def load_aliases(self) -> Dict[str, str]:
+        """Persisted duplicate id -> canonical id mappings whose canonical incident is still stored."""
+        return dict(self.conn.execute(
+            'SELECT a.id, a.canonical_id FROM incident_aliases a JOIN incidents i ON i.id = a.canonical_id'
+        ))
+
+    def drop_aliases(self, canonical_ids: List[str]) -> None:
+        """Forget the aliases of canonical incidents that have left the store."""
+        with self.conn:
+            for chunk in range(0, len(canonical_ids), 500):
+                ids = canonical_ids[chunk:chunk + 500]
+                self.conn.execute(
+                    f"DELETE FROM incident_aliases WHERE canonical_id IN ({','.join('?' * len(ids))})", ids
+                )
+
+    def stored_ids(self, incident_ids: List[str]) -> set:
+        """The given incident ids that are in the incidents table."""
+        found = set()
+        for chunk in range(0, len(incident_ids), 500):
+            ids = incident_ids[chunk:chunk + 500]
+            found.update(row[0] for row in self.conn.execute(
+                f"SELECT id FROM incidents WHERE id IN ({','.join('?' * len(ids))})", ids
+            ))
+        return found
+
+    def timestamp_of(self, incident_id: str) -> Optional[str]:
+        """Stored timestamp of an incident, or None if it is not stored."""
+        row = self.conn.execute('SELECT timestamp FROM incidents WHERE id = ?', (incident_id,)).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM incidents').fetchone()[0]
+
+    def stats(self) -> Dict:
+        """
+        Live statistics from the trigger-maintained counters.
+
+        Returns:
+            Dict: active and per data_type counts of the live incidents, and
+            incidents published in the last 24h
+        """
+        return self.live_stats.snapshot()
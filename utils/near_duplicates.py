@@ -0,0 +1,302 @@
+import re
+import hashlib
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset([
+    'a', 'an', 'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for', 'from', 'by', 'with',
+    'after', 'over', 'into', 'is', 'are', 'was', 'were', 'be', 'been', 'has', 'have', 'had',
+    'as', 'its', 'it', 'this', 'that', 'new', 'says', 'said', 'update', 'news'
+])
+
+# Crude stemming so "charged", "charge" and "charges" compare equal
+STEM_SUFFIXES = ('ing', 'ed', 'es', 's', 'e')
+
+# Mersenne prime for the MinHash permutations
+MINHASH_PRIME = (1 << 61) - 1
+
+
+def tokenize(text: str) -> frozenset:
+    """Lowercased, stopword-free, crudely stemmed word set of a text."""
+    tokens = set()
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        for suffix in STEM_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[:-len(suffix)]
+                break
+        tokens.add(word)
+    return frozenset(tokens)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """
+    Streaming MinHash + LSH index for spotting the same story reported by
+    different outlets.
+
+    Each text is reduced to a MinHash signature of ``bands * rows`` values and
+    filed under one bucket per band. A lookup only compares against entries
+    sharing a bucket, so the cost per new article stays roughly constant as
+    the index grows; candidates are confirmed with the exact Jaccard
+    similarity of their word sets.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 2, threshold: float = 0.5, seed: int = 1):
+        """
+        Args:
+            bands (int): LSH bands; more bands catch lower similarities
+            rows (int): MinHash values per band
+            threshold (float): Minimum word-set Jaccard similarity for a duplicate
+            seed (int): Seed for the hash permutations (fixed so signatures are stable)
+        """
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+
+        rng = random.Random(seed)
+        self.permutations = [(rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME))
+                             for _ in range(bands * rows)]
+
+        self.buckets: Dict[Tuple[int, tuple], set] = {}
+        self.entries: Dict[str, Tuple[frozenset, tuple]] = {}
+
+    def signature(self, tokens: frozenset) -> tuple:
+        hashes = [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'big')
+                  for token in tokens]
+        return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in self.permutations)
+
+    def _band_keys(self, signature: tuple):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: str, tokens: frozenset) -> None:
+        if not tokens or key in self.entries:
+            return
+        signature = self.signature(tokens)
+        self.entries[key] = (tokens, signature)
+        for band_key in self._band_keys(signature):
+            self.buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if not entry:
+            return
+        for band_key in self._band_keys(entry[1]):
+            bucket = self.buckets.get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+
+    def candidates(self, tokens: frozenset) -> List[Tuple[str, float]]:
+        """
+        Indexed keys similar to a word set, most similar first.
+
+        Args:
+            tokens (frozenset): Word set from tokenize()
+
+        Returns:
+            List[Tuple[str, float]]: (key, Jaccard similarity) at or above the threshold
+        """
+        if not tokens:
+            return []
+        signature = self.signature(tokens)
+        keys = set()
+        for band_key in self._band_keys(signature):
+            keys |= self.buckets.get(band_key, set())
+
+        scored = [(key, jaccard(tokens, self.entries[key][0])) for key in keys]
+        return sorted([item for item in scored if item[1] >= self.threshold], key=lambda item: -item[1])
+
+
+class IncidentDeduplicator:
+    """
+    Folds reports of the same incident from different news sources into one
+    canonical incident that lists every source.
+
+    Two reports are the same incident when their title and summary word sets
+    are similar enough, they share crime type and location, and they were
+    published within ``window`` of each other. Merge decisions are remembered
+    by incident id, so a report that keeps appearing on a listing page maps
+    to the same canonical incident on every refresh.
+
+    Only canonical incidents recent enough to receive new duplicates are in
+    the similarity index. Their sources and aliases are kept for as long as
+    the canonical incident is stored, and new aliases are handed out by
+    ``take_new_aliases`` for persisting, so the state can be rebuilt in any
+    process with ``bootstrap``.
+    """
+
+    def __init__(self, window: timedelta = timedelta(hours=72), threshold: float = 0.5):
+        """
+        Args:
+            window (timedelta): Largest publication time gap between duplicates
+            threshold (float): Minimum word-set Jaccard similarity
+        """
+        self.window = window
+        self.threshold = threshold
+        self.index = NearDuplicateIndex(threshold=threshold)
+        self.canonical: Dict[str, Dict] = {}      # canonical id -> {'timestamp', 'type', 'location', 'sources'}
+        self.aliases: Dict[str, str] = {}         # duplicate id -> canonical id
+        self.new_aliases: Dict[str, str] = {}     # aliases not handed out by take_new_aliases yet
+        self.merged_count = 0
+
+    @staticmethod
+    def source_entry(incident: Dict) -> Dict:
+        return {
+            'source': incident.get('source'),
+            'source_url': incident.get('source_url'),
+            'is_official': bool(incident.get('is_official'))
+        }
+
+    def _register(self, incident: Dict, text: str, indexed: bool = True) -> None:
+        self.canonical[incident['id']] = {
+            'timestamp': datetime.fromisoformat(incident['timestamp']),
+            'type': incident.get('type'),
+            'location': incident.get('location'),
+            'sources': incident.get('sources') or [self.source_entry(incident)]
+        }
+        if indexed:
+            self.index.add(incident['id'], tokenize(text))
+
+    def _horizon(self, now: Optional[datetime] = None) -> datetime:
+        """Canonical incidents published before this can no longer receive new duplicates."""
+        return (now or datetime.now()) - 2 * self.window
+
+    def bootstrap(self, incidents: List[Dict], text_of, aliases: Optional[Dict[str, str]] = None,
+                  now: Optional[datetime] = None) -> None:
+        """
+        Replace the in-memory state with the stored canonical incidents and aliases.
+
+        Args:
+            incidents (List[Dict]): Stored canonical incidents
+            text_of (Callable[[Dict], str]): Text to compare for an incident
+            aliases (Optional[Dict[str, str]]): Persisted duplicate id -> canonical id mappings
+            now (Optional[datetime]): Current time
+        """
+        self.index = NearDuplicateIndex(threshold=self.threshold)
+        self.canonical, self.new_aliases = {}, {}
+        horizon = self._horizon(now)
+        for incident in sorted(incidents, key=lambda i: i['timestamp']):
+            indexed = datetime.fromisoformat(incident['timestamp']) >= horizon
+            self._register(incident, text_of(incident) if indexed else '', indexed)
+        self.aliases = {alias: key for alias, key in (aliases or {}).items() if key in self.canonical}
+
+    def take_new_aliases(self) -> Dict[str, str]:
+        """Aliases created since the last call, for the caller to persist."""
+        new_aliases, self.new_aliases = self.new_aliases, {}
+        return new_aliases
+
+    def _find(self, incident: Dict, text: str) -> Optional[str]:
+        timestamp = datetime.fromisoformat(incident['timestamp'])
+        for key, _ in self.index.candidates(tokenize(text)):
+            other = self.canonical[key]
+            if (key != incident['id'] and other['type'] == incident.get('type')
+                    and other['location'] == incident.get('location')
+                    and abs(other['timestamp'] - timestamp) <= self.window):
+                return key
+        return None
+
+    def merge(self, incidents: List[Dict], text_of) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+        """
+        Collapse near-duplicate incidents.
+
+        Args:
+            incidents (List[Dict]): Incidents from this refresh, in source order
+            text_of (Callable[[Dict], str]): Text to compare for an incident
+
+        Returns:
+            Tuple[List[Dict], Dict[str, List[Dict]]]: The canonical incidents of this
+            batch with 'sources' and 'source_count' set, and the source lists of
+            canonical incidents not in this batch that gained a source
+        """
+        batch: Dict[str, Dict] = {}
+        updated_elsewhere: Dict[str, List[Dict]] = {}
+
+        for incident in incidents:
+            incident_id = incident['id']
+            canonical_id = self.aliases.get(incident_id)
+            if canonical_id is None and incident_id not in self.canonical:
+                text = text_of(incident)
+                canonical_id = self._find(incident, text)
+                if canonical_id is None:
+                    self._register(incident, text)
+                else:
+                    self.aliases[incident_id] = canonical_id
+                    self.new_aliases[incident_id] = canonical_id
+                    self.merged_count += 1
+
+            if canonical_id is None:
+                # Canonical report itself: carry over sources gathered from duplicates
+                state = self.canonical[incident_id]
+                batch[incident_id] = {**incident, 'sources': state['sources'],
+                                      'source_count': len(state['sources']),
+                                      'is_official': any(s['is_official'] for s in state['sources'])}
+                continue
+
+            state = self.canonical[canonical_id]
+            entry = self.source_entry(incident)
+            if entry not in state['sources']:
+                state['sources'] = state['sources'] + [entry]
+                if canonical_id in batch:
+                    batch[canonical_id].update(sources=state['sources'], source_count=len(state['sources']),
+                                               is_official=any(s['is_official'] for s in state['sources']))
+                else:
+                    updated_elsewhere[canonical_id] = state['sources']
+
+        for canonical_id in list(updated_elsewhere):
+            if canonical_id in batch:
+                del updated_elsewhere[canonical_id]
+
+        return list(batch.values()), updated_elsewhere
+
+    def prune(self, stored_ids: Optional[Callable[[List[str]], Set[str]]] = None,
+              now: Optional[datetime] = None) -> List[str]:
+        """
+        Drop canonical incidents too old to receive new duplicates from the
+        similarity index, and forget those no longer stored with their aliases.
+
+        Args:
+            stored_ids (Optional[Callable[[List[str]], Set[str]]]): Returns which of the
+                given canonical ids are still stored; without it nothing is forgotten
+            now (Optional[datetime]): Current time
+
+        Returns:
+            List[str]: Canonical ids that were forgotten
+        """
+        horizon = self._horizon(now)
+        old = [key for key, state in self.canonical.items() if state['timestamp'] < horizon]
+        for key in old:
+            self.index.remove(key)
+        if not old or stored_ids is None:
+            return []
+
+        # An alias must outlive the index entry: the duplicate can stay on a listing page for weeks
+        kept = stored_ids(old)
+        forgotten = [key for key in old if key not in kept]
+        for key in forgotten:
+            del self.canonical[key]
+        if forgotten:
+            forgotten_set = set(forgotten)
+            self.aliases = {alias: key for alias, key in self.aliases.items() if key not in forgotten_set}
+            self.new_aliases = {alias: key for alias, key in self.new_aliases.items() if key not in forgotten_set}
+        return forgotten
+
+    def status(self) -> Dict:
+        return {
+            'indexed_incidents': len(self.index.entries),
+            'canonical_incidents': len(self.canonical),
+            'aliases': len(self.aliases),
+            'merged_reports': self.merged_count,
+            'lsh_buckets': len(self.index.buckets)
+        }
@@ -0,0 +1,106 @@
+import os
+import json
+import logging
+from typing import Dict, List, Optional
+
+# Listing layouts shared by several outlets (see utils.article_parser for the selector format)
+WORDPRESS_CATEGORY_LAYOUT = {
+    'articles': [['article'], ['div.post', 'div.entry', 'div.article']],
+    'title': [['h2'], ['h3'], ['a']]
+}
+
+NEWS_ITEM_LAYOUT = {
+    'articles': [['article.post', 'article.news-item', 'article.entry',
+                  'div.post', 'div.news-item', 'div.entry']],
+    'title': [['h1', 'h2', 'h3', 'a']]
+}
+
+# Every news outlet the live feed scrapes. Adding an outlet is one entry here
+# (or in FEED_SOURCES_FILE); the aggregator runs all of them with one engine.
+#   relevance: classifier flag an article title must carry ('crime_related' or 'police_related')
+#   limit:     articles examined per listing page
+#   official:  government source, marked as verified
+NEWS_SOURCES = [
+    {
+        'id': 'observer',
+        'name': 'St. Kitts Nevis Observer',
+        'url': 'https://www.thestkittsnevisobserver.com/category/crime/',
+        'layout': WORDPRESS_CATEGORY_LAYOUT,
+        'relevance': 'crime_related',
+        'limit': 10,
+        'official': False
+    },
+    {
+        'id': 'sknis',
+        'name': 'SKNIS Government News',
+        'url': 'https://www.sknis.gov.kn/',
+        'layout': NEWS_ITEM_LAYOUT,
+        'relevance': 'police_related',
+        'limit': 15,
+        'official': True
+    },
+    {
+        'id': 'winnfm',
+        'name': 'WINN FM News',
+        'url': 'https://www.winnmediaskn.com/',
+        'layout': NEWS_ITEM_LAYOUT,
+        'relevance': 'crime_related',
+        'limit': 10,
+        'official': False
+    }
+]
+
+SOURCE_DEFAULTS = {
+    'enabled': True,
+    'layout': NEWS_ITEM_LAYOUT,
+    'relevance': 'crime_related',
+    'limit': 10,
+    'official': False
+}
+
+REQUIRED_FIELDS = ('id', 'name', 'url')
+
+logger = logging.getLogger(__name__)
+
+
+def load_source_registry(path: Optional[str] = None) -> List[Dict]:
+    """
+    Build the source registry: the built-in outlets plus any from a JSON file.
+
+    Entries in the file are merged by id, so they can add outlets, disable one
+    (``{"id": "winnfm", "enabled": false}``), override its selectors or
+    declare the strptime ``date_format`` its article dates use.
+
+    Args:
+        path (Optional[str]): JSON file holding a list of source entries;
+            defaults to FEED_SOURCES_FILE; a missing file is logged and ignored
+
+    Returns:
+        List[Dict]: Complete source entries in registry order
+
+    Raises:
+        ValueError: If a new entry is missing id, name or url
+    """
+    registry = {source['id']: {**SOURCE_DEFAULTS, **source} for source in NEWS_SOURCES}
+
+    path = path or os.environ.get('FEED_SOURCES_FILE')
+    if path and not os.path.exists(path):
+        logger.warning(f"News source file {path} not found, using the built-in sources")
+        path = None
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            extra_sources = json.load(f)
+
+        for entry in extra_sources:
+            if entry.get('id') in registry:
+                registry[entry['id']].update(entry)
+                continue
+
+            missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+            if missing:
+                raise ValueError(f"News source {entry.get('id')!r} is missing {', '.join(missing)}")
+            registry[entry['id']] = {**SOURCE_DEFAULTS, **entry}
+
+        logger.info(f"Loaded {len(extra_sources)} news source entries from {path}")
+
+    return list(registry.values())
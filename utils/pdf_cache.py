@@ -0,0 +1,161 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write a file so readers in other processes only ever see complete contents."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class PDFCache:
+    """
+    Content-addressed on-disk cache for police.kn PDF reports.
+
+    Raw PDFs are stored under the SHA-256 of their bytes and extracted
+    per-page text under that hash plus the extractor version, so identical
+    documents published at several URLs share one copy and an extractor
+    upgrade re-extracts instead of serving stale text. A small index maps
+    each URL to its hash and HTTP validators (ETag, Last-Modified) for
+    conditional revalidation.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Cache root; created if missing
+        """
+        self.directory = directory
+        self.blob_dir = os.path.join(directory, 'pdf')
+        self.text_dir = os.path.join(directory, 'text')
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.text_dir, exist_ok=True)
+        self.index: Dict[str, Dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        write_atomic(self.index_path, json.dumps(self.index, indent=2, sort_keys=True).encode())
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, f'{digest}.pdf')
+
+    def _text_path(self, digest: str, extractor: str) -> str:
+        return os.path.join(self.text_dir, f'{digest}-{extractor}.json')
+
+    def entry(self, url: str) -> Optional[Dict]:
+        """Index entry for a URL whose PDF is present on disk, else None."""
+        if url not in self.index:
+            # Another worker may have fetched it since we loaded the index
+            self.index = self._load_index()
+        entry = self.index.get(url)
+        if entry and os.path.exists(self._blob_path(entry['sha256'])):
+            return entry
+        return None
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for revalidating a cached URL."""
+        entry = self.entry(url) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_pdf(self, digest: str) -> bytes:
+        with open(self._blob_path(digest), 'rb') as f:
+            return f.read()
+
+    def store_pdf(self, url: str, content: bytes, etag: Optional[str] = None,
+                  last_modified: Optional[str] = None) -> str:
+        """
+        Store downloaded PDF bytes and point the URL at them.
+
+        Args:
+            url (str): Source URL
+            content (bytes): PDF bytes
+            etag (Optional[str]): ETag response header
+            last_modified (Optional[str]): Last-Modified response header
+
+        Returns:
+            str: SHA-256 of the content
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            write_atomic(path, content)
+
+        with self._lock:
+            self.index = self._load_index()
+            self.index[url] = {
+                'sha256': digest,
+                'etag': etag,
+                'last_modified': last_modified,
+                'bytes': len(content),
+                'fetched_at': datetime.now().isoformat()
+            }
+            self._save_index()
+        return digest
+
+    def touch(self, url: str) -> None:
+        """Record a successful revalidation (304) of a cached URL."""
+        with self._lock:
+            self.index = self._load_index()
+            if url in self.index:
+                self.index[url]['validated_at'] = datetime.now().isoformat()
+                self._save_index()
+
+    def has_pages(self, digest: str, extractor: str) -> bool:
+        return os.path.exists(self._text_path(digest, extractor))
+
+    def pages(self, digest: str, extractor: str, extract: Callable[[bytes], List[str]]) -> List[str]:
+        """
+        Per-page text of a cached PDF, extracting and caching it on first use.
+
+        Args:
+            digest (str): SHA-256 of the PDF
+            extractor (str): Extractor name and version, part of the cache key
+            extract (Callable[[bytes], List[str]]): Extracts page texts from PDF bytes
+
+        Returns:
+            List[str]: Text of each page
+        """
+        path = self._text_path(digest, extractor)
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)['pages']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        pages = extract(self.read_pdf(digest))
+        write_atomic(path, json.dumps({'sha256': digest, 'extractor': extractor, 'pages': pages}).encode())
+        return pages
+
+    def status(self) -> Dict:
+        return {
+            'directory': self.directory,
+            'cached_urls': len(self.index),
+            'cached_pdfs': sum(1 for name in os.listdir(self.blob_dir) if name.endswith('.pdf')),
+            'cached_texts': sum(1 for name in os.listdir(self.text_dir) if name.endswith('.json'))
+        }
@@ -1,12 +1,34 @@
+import os
 import requests
 import PyPDF2
 import io
 import re
+import time
 import json
 from datetime import datetime
-import pandas as pd
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+try:
+    from utils.pdf_cache import PDFCache
+    from utils.pdf_jobs import PDFJobRunner
+    from utils.pdf_manifest import PDFManifest
+    from utils.crime_statistics import CrimeStatisticsScanner, STATISTICS_VERSION
+except ImportError:  # run as a script from inside utils/
+    from pdf_cache import PDFCache
+    from pdf_jobs import PDFJobRunner
+    from pdf_manifest import PDFManifest
+    from crime_statistics import CrimeStatisticsScanner, STATISTICS_VERSION
+
+PDF_CACHE_DIR = os.environ.get('PDF_CACHE_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'pdf_cache'))
+# Part of the extracted-text cache key, so upgrading PyPDF2 re-extracts
+PDF_EXTRACTOR = f"pypdf2-{PyPDF2.__version__}"
+# Part of the manifest key with the extractor, so statistics logic changes re-analyze
+PDF_ANALYZER = f"statistics-v{STATISTICS_VERSION}"
+PDF_DOWNLOAD_WORKERS = int(os.environ.get('PDF_DOWNLOAD_WORKERS', 8))
+PDF_EXTRACT_WORKERS = int(os.environ.get('PDF_EXTRACT_WORKERS', 0)) or os.cpu_count() or 1
 
 class SECUROPDFDataIntegrator:
     """
@@ -14,7 +36,7 @@ class SECUROPDFDataIntegrator:
     Fetches and processes crime statistics from St. Kitts & Nevis Police Force PDF reports.
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: str = None):
         self.pdf_sources = [
             "http://www.police.kn/statistics/links/1752416412.pdf",
             "http://www.police.kn/statistics/links/1752414290.pdf", 
@@ -74,35 +96,92 @@ class SECUROPDFDataIntegrator:
             ]
         }
         
+        self.statistics_scanner = CrimeStatisticsScanner(self.crime_patterns)
+        
         self.logger = logging.getLogger(__name__)
         
-    def fetch_pdf_content(self, url: str) -> Optional[str]:
+        # Published reports never change, so PDFs and their text are fetched and extracted once
+        self.cache = PDFCache(cache_dir or PDF_CACHE_DIR)
+        self.cache_stats = {'hits': 0, 'revalidated': 0, 'downloads': 0}
+        
+        # Analyzed documents are not analyzed again unless their content changes
+        self.manifest = PDFManifest(os.path.join(self.cache.directory, 'manifest.json'))
+        self.ingest_stats = {'processed': 0, 'unchanged': 0}
+        
+    def download_pdf(self, url: str, revalidate: bool = False) -> str:
         """
-        Fetch PDF content from URL and extract text.
+        Make sure a PDF is in the cache, downloading it only when needed.
         
         Args:
             url (str): PDF URL
+            revalidate (bool): Check a cached copy with a conditional request
             
         Returns:
-            Optional[str]: Extracted text content or None if failed
+            str: SHA-256 of the PDF content in the cache
         """
+        entry = self.cache.entry(url)
+        if entry and not revalidate:
+            self.cache_stats['hits'] += 1
+            return entry['sha256']
+        
+        self.logger.info(f"Fetching PDF from: {url}")
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        if entry:
+            headers.update(self.cache.validators(url))
+        
         try:
-            self.logger.info(f"Fetching PDF from: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
             response = requests.get(url, headers=headers, timeout=30)
+            if entry and response.status_code == 304:
+                self.cache.touch(url)
+                self.cache_stats['revalidated'] += 1
+                return entry['sha256']
             response.raise_for_status()
+        except requests.RequestException as e:
+            if not entry:
+                raise
+            # Keep serving the cached copy when the site is unreachable
+            self.logger.warning(f"Revalidation of {url} failed, using cached copy: {str(e)}")
+            self.cache_stats['hits'] += 1
+            return entry['sha256']
+        
+        self.cache_stats['downloads'] += 1
+        return self.cache.store_pdf(url, response.content,
+                                    etag=response.headers.get('ETag'),
+                                    last_modified=response.headers.get('Last-Modified'))
+    
+    @staticmethod
+    def extract_pages(content: bytes) -> List[str]:
+        """
+        Extract the text of each page of a PDF.
+        
+        Args:
+            content (bytes): PDF bytes
+            
+        Returns:
+            List[str]: Text of each page
+        """
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        return [page.extract_text() for page in pdf_reader.pages]
+    
+    def fetch_pdf_content(self, url: str, revalidate: bool = False) -> Optional[str]:
+        """
+        Fetch PDF content from URL and extract text, both through the on-disk cache.
+        
+        Args:
+            url (str): PDF URL
+            revalidate (bool): Check a cached copy with a conditional request
             
-            # Read PDF content
-            pdf_file = io.BytesIO(response.content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+        Returns:
+            Optional[str]: Extracted text content or None if failed
+        """
+        try:
+            digest = self.download_pdf(url, revalidate)
+            pages = self.cache.pages(digest, PDF_EXTRACTOR, self.extract_pages)
             
-            text_content = ""
-            for page in pdf_reader.pages:
-                text_content += page.extract_text() + "\n"
+            text_content = "".join(page + "\n" for page in pages)
             
             self.logger.info(f"Successfully extracted {len(text_content)} characters from PDF")
             return text_content
@@ -160,47 +239,8 @@ class SECUROPDFDataIntegrator:
         }
         
         try:
-            # Normalize text
-            text = text.lower()
-            
-            # Extract all numbers from text
-            numbers = re.findall(r'\b\d{1,4}\b', text)
-            stats['extracted_numbers'] = [int(n) for n in numbers if 1 <= int(n) <= 5000]
-            
-            # Look for specific crime type patterns
-            for crime_type, patterns in self.crime_patterns.items():
-                for pattern in patterns:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        # Look for numbers near the match
-                        start = max(0, match.start() - 50)
-                        end = min(len(text), match.end() + 50)
-                        context = text[start:end]
-                        
-                        # Find numbers in context
-                        context_numbers = re.findall(r'\b(\d{1,4})\b', context)
-                        if context_numbers:
-                            # Take the first reasonable number
-                            for num_str in context_numbers:
-                                num = int(num_str)
-                                if 1 <= num <= 2000:  # Reasonable range for crime stats
-                                    stats[crime_type] = max(stats[crime_type], num)
-                                    break
-            
-            # Look for total crimes
-            total_patterns = [
-                r'total\s+crime[s]?[:\s]+(\d{1,4})',
-                r'total[:\s]+(\d{1,4})',
-                r'overall[:\s]+(\d{1,4})'
-            ]
-            
-            for pattern in total_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    total = int(match.group(1))
-                    if 500 <= total <= 5000:  # Reasonable range
-                        stats['total_crimes'] = total
-                        break
+            # One scan resolves the number list, crime-type counts and labelled values
+            stats.update(self.statistics_scanner.extract(text))
             
             # If no total found, estimate from components
             if stats['total_crimes'] == 0:
@@ -209,36 +249,6 @@ class SECUROPDFDataIntegrator:
                 if component_total > 0:
                     stats['total_crimes'] = component_total
             
-            # Look for homicides specifically
-            homicide_patterns = [
-                r'homicide[s]?[:\s]+(\d{1,3})',
-                r'murder[s]?[:\s]+(\d{1,3})',
-                r'killing[s]?[:\s]+(\d{1,3})'
-            ]
-            
-            for pattern in homicide_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    homicides = int(match.group(1))
-                    if 0 <= homicides <= 100:  # Reasonable range
-                        stats['homicides'] = homicides
-                        break
-            
-            # Look for clearance rate
-            clearance_patterns = [
-                r'clearance\s+rate[:\s]+(\d{1,3})%?',
-                r'solved[:\s]+(\d{1,3})%?',
-                r'resolution[:\s]+(\d{1,3})%?'
-            ]
-            
-            for pattern in clearance_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    rate = int(match.group(1))
-                    if 0 <= rate <= 100:
-                        stats['clearance_rate'] = rate
-                        break
-            
             # Calculate confidence score
             confidence = 0
             if stats['total_crimes'] > 0:
@@ -259,64 +269,179 @@ class SECUROPDFDataIntegrator:
         
         return stats
     
-    def process_all_pdfs(self) -> Dict[int, Dict]:
+    def analyze_pdf(self, url: str, digest: str) -> Optional[Dict]:
+        """
+        Extract text (through the cache) and crime statistics for one downloaded PDF.
+        Runs in extraction worker processes as well as in-process.
+        
+        Args:
+            url (str): PDF URL
+            digest (str): SHA-256 of the cached PDF
+            
+        Returns:
+            Optional[Dict]: Extracted statistics, or None if no valid year was found
+        """
+        pages = self.cache.pages(digest, PDF_EXTRACTOR, self.extract_pages)
+        text_content = "".join(page + "\n" for page in pages)
+        if not text_content:
+            return None
+        
+        # Extract year
+        year = self.extract_year_from_url(url)
+        if not year:
+            # Try to extract year from content
+            year_match = re.search(r'\b(20[1-2][0-9])\b', text_content)
+            if year_match:
+                year = int(year_match.group(1))
+        
+        if not year or year < 2016 or year > 2024:
+            self.logger.warning(f"Could not determine valid year for {url}")
+            return None
+        
+        # Extract statistics
+        return self.extract_crime_statistics(text_content, year)
+    
+    def timed_analyze_pdf(self, url: str, digest: str) -> Tuple[Optional[Dict], float]:
+        started = time.perf_counter()
+        stats = self.analyze_pdf(url, digest)
+        return stats, time.perf_counter() - started
+    
+    @staticmethod
+    def _outcome(stats: Optional[Dict], seconds: float) -> Tuple[str, Dict]:
+        details = {'extract_seconds': round(seconds, 3)}
+        if not stats:
+            return 'skipped', details
+        details.update(year=stats['year'], confidence_score=stats['confidence_score'])
+        return 'done', details
+    
+    def _timed_download(self, url: str, revalidate: bool) -> Tuple[str, float]:
+        started = time.perf_counter()
+        digest = self.download_pdf(url, revalidate)
+        return digest, time.perf_counter() - started
+    
+    def process_all_pdfs(self, revalidate: bool = False, workers: int = None,
+                         on_progress: Callable[[str, str, Dict], None] = None,
+                         reprocess: bool = False) -> Dict[int, Dict]:
         """
         Process all PDF sources and extract historical crime data.
         
+        Downloads overlap on a thread pool. Text extraction and statistics are
+        CPU-bound pure Python, so they run in a process pool when any PDF still
+        needs extracting. Results are merged in source order, so the outcome
+        does not depend on which PDF finishes first.
+        
+        Args:
+            revalidate (bool): Check cached PDFs against the server instead of trusting the cache
+            workers (int): Extraction processes; defaults to PDF_EXTRACT_WORKERS
+            on_progress (Callable[[str, str, Dict], None]): Called with (url, stage, details)
+                as each PDF is downloaded and analyzed
+            reprocess (bool): Analyze every PDF again instead of only new or changed ones
+            
         Returns:
             Dict[int, Dict]: Historical crime data by year
         """
         historical_data = {}
         processed_count = 0
+        report = on_progress or (lambda url, stage, details: None)
         
         self.logger.info(f"Starting to process {len(self.pdf_sources)} PDF sources...")
         
+        # Documents already in the manifest are only fetched to check them for changes
+        to_fetch = [url for url in self.pdf_sources
+                    if reprocess or revalidate or not self.manifest.is_analyzed(url, PDF_ANALYZER)]
+        unchanged = [url for url in self.pdf_sources if url not in to_fetch]
+        for url in unchanged:
+            report(url, 'unchanged', {})
+        
+        # Fetch (or revalidate) the PDFs concurrently
+        digests = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(PDF_DOWNLOAD_WORKERS, len(to_fetch))),
+                                thread_name_prefix='pdf-download') as pool:
+            futures = {pool.submit(self._timed_download, url, revalidate): url for url in to_fetch}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    digests[url], seconds = future.result()
+                    report(url, 'downloaded', {'download_seconds': round(seconds, 3)})
+                except Exception as e:
+                    self.logger.error(f"Failed to fetch PDF from {url}: {str(e)}")
+                    report(url, 'download_failed', {'error': str(e)})
+        
+        downloaded = []
+        for url in to_fetch:
+            if url not in digests:
+                continue
+            if not reprocess and self.manifest.is_current(url, digests[url], PDF_EXTRACTOR, PDF_ANALYZER):
+                unchanged.append(url)
+                report(url, 'unchanged', {})
+            else:
+                downloaded.append(url)
+        self.ingest_stats['unchanged'] += len(unchanged)
+        workers = workers or PDF_EXTRACT_WORKERS
+        needs_extraction = [url for url in downloaded if not self.cache.has_pages(digests[url], PDF_EXTRACTOR)]
+        
+        results = {}
+        if workers > 1 and len(needs_extraction) > 1:
+            # Spawned (not forked) workers: the caller may be a threaded web server
+            with ProcessPoolExecutor(max_workers=min(workers, len(downloaded)),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_extraction_worker,
+                                     initargs=(self.cache.directory,)) as pool:
+                futures = {pool.submit(_analyze_in_worker, url, digests[url]): url for url in downloaded}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        results[url], seconds = future.result()
+                        report(url, *self._outcome(results[url], seconds))
+                    except Exception as e:
+                        self.logger.error(f"Error processing {url}: {str(e)}")
+                        report(url, 'failed', {'error': str(e)})
+        else:
+            # Everything already extracted: the statistics pass is too cheap to ship to processes
+            for url in downloaded:
+                try:
+                    results[url], seconds = self.timed_analyze_pdf(url, digests[url])
+                    report(url, *self._outcome(results[url], seconds))
+                except Exception as e:
+                    self.logger.error(f"Error processing {url}: {str(e)}")
+                    report(url, 'failed', {'error': str(e)})
+        
+        for url in results:
+            self.manifest.record(url, digests[url], PDF_EXTRACTOR, PDF_ANALYZER, results[url])
+        if results:
+            self.manifest.save(results)
+        self.ingest_stats['processed'] += len(results)
+        self.logger.info(f"Analyzed {len(results)} new or changed PDFs, {len(unchanged)} unchanged")
+        
+        # Per-year results are rebuilt in source order from the manifest, so an
+        # incremental refresh merges exactly like a full reprocess would
         for i, url in enumerate(self.pdf_sources):
-            try:
-                self.logger.info(f"Processing PDF {i+1}/{len(self.pdf_sources)}: {url}")
-                
-                # Fetch PDF content
-                text_content = self.fetch_pdf_content(url)
-                if not text_content:
-                    continue
-                
-                # Extract year
-                year = self.extract_year_from_url(url)
-                if not year:
-                    # Try to extract year from content
-                    year_match = re.search(r'\b(20[1-2][0-9])\b', text_content)
-                    if year_match:
-                        year = int(year_match.group(1))
-                
-                if not year or year < 2016 or year > 2024:
-                    self.logger.warning(f"Could not determine valid year for {url}")
-                    continue
-                
-                # Extract statistics
-                stats = self.extract_crime_statistics(text_content, year)
-                
-                if stats['confidence_score'] > 20:  # Only keep if reasonably confident
-                    if year not in historical_data:
+            entry = self.manifest.get(url)
+            if not entry or not entry['stats']:
+                continue
+            # Copied because merging below updates the year's first record in place
+            stats = dict(entry['stats'])
+            self.logger.info(f"Processing PDF {i+1}/{len(self.pdf_sources)}: {url}")
+            year = stats['year']
+            
+            if stats['confidence_score'] > 20:  # Only keep if reasonably confident
+                if year not in historical_data:
+                    historical_data[year] = stats
+                else:
+                    # Merge with existing data for the year
+                    existing = historical_data[year]
+                    if stats['confidence_score'] > existing['confidence_score']:
                         historical_data[year] = stats
                     else:
-                        # Merge with existing data for the year
-                        existing = historical_data[year]
-                        if stats['confidence_score'] > existing['confidence_score']:
-                            historical_data[year] = stats
-                        else:
-                            # Merge non-zero values
-                            for key in stats:
-                                if isinstance(stats[key], int) and stats[key] > existing[key]:
-                                    existing[key] = stats[key]
-                    
-                    processed_count += 1
-                    self.logger.info(f"Successfully processed data for year {year} (confidence: {stats['confidence_score']}%)")
-                else:
-                    self.logger.warning(f"Low confidence data from {url} (confidence: {stats['confidence_score']}%)")
+                        # Merge non-zero values
+                        for key in stats:
+                            if isinstance(stats[key], int) and stats[key] > existing[key]:
+                                existing[key] = stats[key]
                 
-            except Exception as e:
-                self.logger.error(f"Error processing {url}: {str(e)}")
-                continue
+                processed_count += 1
+                self.logger.info(f"Successfully processed data for year {year} (confidence: {stats['confidence_score']}%)")
+            else:
+                self.logger.warning(f"Low confidence data from {url} (confidence: {stats['confidence_score']}%)")
         
         self.logger.info(f"Successfully processed {processed_count} PDFs, extracted data for {len(historical_data)} years")
         return historical_data
@@ -520,6 +645,17 @@ class SECUROPDFDataIntegrator:
         return json_string
 
 
+# Extraction worker processes keep one integrator each
+_worker_integrator = None
+
+def _init_extraction_worker(cache_dir: str):
+    global _worker_integrator
+    _worker_integrator = SECUROPDFDataIntegrator(cache_dir)
+
+def _analyze_in_worker(url: str, digest: str) -> Tuple[Optional[Dict], float]:
+    return _worker_integrator.timed_analyze_pdf(url, digest)
+
+
 # Usage example for integration with Flask backend
 def integrate_pdf_data_with_backend():
     """
@@ -558,24 +694,38 @@ def add_pdf_integration_routes(app):
     """
     Add PDF integration routes to Flask app.
     """
+    from flask import jsonify, url_for
+    
+    # Job table lives next to the PDF cache so every worker sees the same jobs
+    job_runner = PDFJobRunner(os.environ.get('PDF_JOBS_DB', os.path.join(PDF_CACHE_DIR, 'jobs.db')))
+    
+    def run_refresh(progress):
+        integrator = SECUROPDFDataIntegrator()
+        progress.start(integrator.pdf_sources)
+        extracted_data = integrator.process_all_pdfs(revalidate=True, on_progress=progress)
+        enhanced_data = integrator.supplement_with_known_data(extracted_data)
+        return {
+            'years_processed': list(enhanced_data.keys()),
+            'total_years': len(enhanced_data),
+            'cache': integrator.cache_stats,
+            'ingest': integrator.ingest_stats,
+            'last_updated': datetime.now().isoformat()
+        }
     
     @app.route('/api/pdf-integration/refresh', methods=['POST'])
     def refresh_pdf_data():
-        """API endpoint to refresh PDF data."""
+        """API endpoint to start (or join) a background PDF data refresh."""
         try:
-            integrator = SECUROPDFDataIntegrator()
-            
-            # Process PDFs in background (in production, use Celery or similar)
-            extracted_data = integrator.process_all_pdfs()
-            enhanced_data = integrator.supplement_with_known_data(extracted_data)
+            job, created = job_runner.submit('refresh', run_refresh)
             
             return jsonify({
                 'success': True,
-                'message': 'PDF data refreshed successfully',
-                'years_processed': list(enhanced_data.keys()),
-                'total_years': len(enhanced_data),
-                'last_updated': datetime.now().isoformat()
-            })
+                'message': 'PDF data refresh started' if created else 'PDF data refresh already running',
+                'job_id': job['id'],
+                'status': job['status'],
+                'deduplicated': not created,
+                'status_url': url_for('get_pdf_job', job_id=job['id'])
+            }), 202
             
         except Exception as e:
             return jsonify({
@@ -584,6 +734,19 @@ def add_pdf_integration_routes(app):
                 'error_code': 'PDF_INTEGRATION_ERROR'
             }), 500
     
+    @app.route('/api/pdf-integration/jobs/<job_id>', methods=['GET'])
+    def get_pdf_job(job_id):
+        """Progress and per-PDF timings of a PDF integration job."""
+        job = job_runner.get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': f'Unknown job: {job_id}',
+                'error_code': 'JOB_NOT_FOUND'
+            }), 404
+        
+        return jsonify({'success': True, 'job': job})
+    
     @app.route('/api/pdf-integration/status', methods=['GET'])
     def get_pdf_integration_status():
         """Get PDF integration status."""
@@ -605,6 +768,8 @@ def add_pdf_integration_routes(app):
                 'total_sources': len(integrator.pdf_sources),
                 'available_sources': available_sources,
                 'availability_percentage': (available_sources / 5) * 100,
+                'cache': integrator.cache.status(),
+                'manifest': integrator.manifest.status(),
                 'last_check': datetime.now().isoformat()
             })
             
@@ -621,8 +786,7 @@ def add_pdf_integration_routes(app):
         try:
             integrator = SECUROPDFDataIntegrator()
             
-            # Use cached data if available, otherwise process
-            # In production, implement proper caching
+            # Served from the PDF/text cache; only uncached reports touch police.kn
             extracted_data = integrator.process_all_pdfs()
             enhanced_data = integrator.supplement_with_known_data(extracted_data)
             
@@ -632,6 +796,7 @@ def add_pdf_integration_routes(app):
                 'success': True,
                 'chart_config': chart_config,
                 'data_years': sorted(enhanced_data.keys()),
+                'cache': integrator.cache_stats,
                 'generated_at': datetime.now().isoformat()
             })
             
@@ -0,0 +1,202 @@
+import os
+import json
+import uuid
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Per-item stages that count as finished
+FINISHED_STAGES = ('done', 'skipped', 'unchanged', 'failed', 'download_failed')
+
+
+class JobProgress:
+    """
+    Progress reporter handed to a running job. Calling it records one event
+    for one item (a PDF URL) and persists the job's per-item state.
+    """
+
+    def __init__(self, runner: 'PDFJobRunner', job_id: str):
+        self.runner = runner
+        self.job_id = job_id
+        self.items: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def start(self, items: List[str]) -> None:
+        """Declare the items this job will work through."""
+        with self._lock:
+            self.items = {item: {'stage': 'pending'} for item in items}
+            self._save()
+
+    def __call__(self, item: str, stage: str, details: Optional[Dict] = None) -> None:
+        """
+        Record that an item reached a stage.
+
+        Args:
+            item (str): Item identifier (PDF URL)
+            stage (str): 'downloaded', 'done', 'skipped', 'unchanged', 'failed' or 'download_failed'
+            details (Optional[Dict]): Timings and results for the stage
+        """
+        with self._lock:
+            state = self.items.setdefault(item, {})
+            state.update(details or {}, stage=stage)
+            self._save()
+
+    def _save(self) -> None:
+        completed = sum(1 for state in self.items.values() if state.get('stage') in FINISHED_STAGES)
+        self.runner.update(self.job_id, total=len(self.items), completed=completed,
+                           items=json.dumps(self.items))
+
+
+class PDFJobRunner:
+    """
+    In-process background runner for long PDF jobs with a persistent job table.
+
+    Jobs run on a daemon thread so the request that starts one returns
+    immediately. Jobs are kept in SQLite, so any worker can report on any
+    job. A partial unique index allows one active job per kind, which makes
+    concurrent refresh requests from any worker share the running job. A job
+    whose owner stopped sending heartbeats (e.g. its worker was killed) is
+    marked interrupted so a new one can start.
+    """
+
+    def __init__(self, db_path: str, stale_after: int = 300, heartbeat: int = 30):
+        """
+        Args:
+            db_path (str): Path to the SQLite job database
+            stale_after (int): Seconds without a heartbeat after which an active job is abandoned
+            heartbeat (int): Seconds between heartbeats of a running job
+        """
+        self.db_path = db_path
+        self.stale_after = stale_after
+        self.heartbeat = heartbeat
+        self._local = threading.local()
+        self.logger = logging.getLogger(__name__)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS pdf_jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    owner_pid INTEGER,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    heartbeat_at TEXT NOT NULL,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    items TEXT NOT NULL DEFAULT '{}',
+                    result TEXT,
+                    error TEXT
+                );
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_pdf_jobs_active ON pdf_jobs (kind)
+                    WHERE status IN ('queued', 'running');
+                CREATE INDEX IF NOT EXISTS idx_pdf_jobs_created ON pdf_jobs (created_at DESC);
+            """)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Per-thread connection; SQLite connections must not be shared across threads."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=10000')
+            self._local.conn = conn
+        return conn
+
+    def update(self, job_id: str, **fields) -> None:
+        fields['heartbeat_at'] = datetime.now().isoformat()
+        assignments = ', '.join(f'{column} = ?' for column in fields)
+        with self.conn:
+            self.conn.execute(f'UPDATE pdf_jobs SET {assignments} WHERE id = ?', list(fields.values()) + [job_id])
+
+    def _expire_stale(self) -> None:
+        cutoff = (datetime.now() - timedelta(seconds=self.stale_after)).isoformat()
+        with self.conn:
+            self.conn.execute("""
+                UPDATE pdf_jobs SET status = 'interrupted', finished_at = ?, error = 'Job stopped reporting progress'
+                WHERE status IN ('queued', 'running') AND heartbeat_at < ?
+            """, (datetime.now().isoformat(), cutoff))
+
+    def submit(self, kind: str, target: Callable[[JobProgress], Dict]) -> Tuple[Dict, bool]:
+        """
+        Start a job, or join the active job of the same kind.
+
+        Args:
+            kind (str): Job kind; at most one job per kind is active at a time
+            target (Callable[[JobProgress], Dict]): Work to run; returns the job result
+
+        Returns:
+            Tuple[Dict, bool]: The job, and whether this call created it
+        """
+        self._expire_stale()
+        job_id = uuid.uuid4().hex[:16]
+        now = datetime.now().isoformat()
+        try:
+            with self.conn:
+                self.conn.execute("""
+                    INSERT INTO pdf_jobs (id, kind, status, owner_pid, created_at, heartbeat_at)
+                    VALUES (?, ?, 'queued', ?, ?, ?)
+                """, (job_id, kind, os.getpid(), now, now))
+        except sqlite3.IntegrityError:
+            row = self.conn.execute(
+                "SELECT id FROM pdf_jobs WHERE kind = ? AND status IN ('queued', 'running')", (kind,)
+            ).fetchone()
+            if row:
+                return self.get(row['id']), False
+            # The active job finished in between; try again
+            return self.submit(kind, target)
+
+        threading.Thread(target=self._run, args=(job_id, target), name=f'pdf-job-{job_id}', daemon=True).start()
+        return self.get(job_id), True
+
+    def _run(self, job_id: str, target: Callable[[JobProgress], Dict]) -> None:
+        self.update(job_id, status='running', started_at=datetime.now().isoformat())
+
+        # Slow items must not make a live job look abandoned
+        finished = threading.Event()
+
+        def beat():
+            while not finished.wait(self.heartbeat):
+                self.update(job_id)
+
+        threading.Thread(target=beat, name=f'pdf-job-{job_id}-heartbeat', daemon=True).start()
+        try:
+            result = target(JobProgress(self, job_id))
+            self.update(job_id, status='succeeded', finished_at=datetime.now().isoformat(),
+                        result=json.dumps(result, default=str))
+        except Exception as e:
+            self.logger.error(f"PDF job {job_id} failed: {str(e)}")
+            self.update(job_id, status='failed', finished_at=datetime.now().isoformat(), error=str(e))
+        finally:
+            finished.set()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Current state of a job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            Optional[Dict]: Job with per-item progress and timings, or None if unknown
+        """
+        row = self.conn.execute('SELECT * FROM pdf_jobs WHERE id = ?', (job_id,)).fetchone()
+        if not row:
+            return None
+        job = dict(row)
+        job['items'] = json.loads(job['items'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['progress_percentage'] = round(100 * job['completed'] / job['total'], 1) if job['total'] else 0
+        if job['started_at']:
+            end = datetime.fromisoformat(job['finished_at']) if job['finished_at'] else datetime.now()
+            job['elapsed_seconds'] = round((end - datetime.fromisoformat(job['started_at'])).total_seconds(), 3)
+        return job
@@ -0,0 +1,98 @@
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+try:
+    from utils.pdf_cache import write_atomic
+except ImportError:  # run as a script from inside utils/
+    from pdf_cache import write_atomic
+
+
+class PDFManifest:
+    """
+    Record of every PDF report that has been analyzed.
+
+    Each URL maps to the content hash, text extractor and statistics version
+    it was analyzed with, when it was analyzed, the detected year, the
+    confidence score and the extracted statistics. A document whose hash,
+    extractor and statistics version match its record is never analyzed
+    again, so a refresh only does work for new or changed reports, or for
+    every report once the statistics logic changes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Manifest JSON file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.records: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self.records.get(url)
+
+    def is_analyzed(self, url: str, analyzer: str) -> bool:
+        """Whether a URL has a record from this statistics version (its content may have changed since)."""
+        record = self.records.get(url)
+        return bool(record) and record.get('analyzer') == analyzer
+
+    def is_current(self, url: str, digest: str, extractor: str, analyzer: str) -> bool:
+        """Whether a URL was already analyzed from this exact content, extractor and statistics version."""
+        record = self.records.get(url)
+        return (self.is_analyzed(url, analyzer) and record['sha256'] == digest
+                and record['extractor'] == extractor)
+
+    def record(self, url: str, digest: str, extractor: str, analyzer: str, stats: Optional[Dict]) -> Dict:
+        """
+        Build the manifest entry for an analyzed document (saved by ``save``).
+
+        Args:
+            url (str): Source URL
+            digest (str): SHA-256 of the PDF content
+            extractor (str): Text extractor name and version
+            analyzer (str): Statistics logic version
+            stats (Optional[Dict]): Extracted statistics, or None if no valid year was found
+
+        Returns:
+            Dict: The new entry
+        """
+        entry = {
+            'sha256': digest,
+            'extractor': extractor,
+            'analyzer': analyzer,
+            'extracted_at': datetime.now().isoformat(),
+            'year': stats['year'] if stats else None,
+            'confidence_score': stats['confidence_score'] if stats else None,
+            'stats': stats
+        }
+        with self._lock:
+            self.records[url] = entry
+        return entry
+
+    def save(self, urls) -> None:
+        """Persist the entries for ``urls``, keeping entries other workers wrote meanwhile."""
+        with self._lock:
+            merged = self._load()
+            merged.update({url: self.records[url] for url in urls if url in self.records})
+            self.records = merged
+            write_atomic(self.path, json.dumps(self.records, sort_keys=True).encode())
+
+    def status(self) -> Dict:
+        years = {}
+        for entry in self.records.values():
+            if entry['year']:
+                years[entry['year']] = years.get(entry['year'], 0) + 1
+        return {
+            'documents': len(self.records),
+            'documents_by_year': dict(sorted(years.items())),
+            'last_extracted_at': max((entry['extracted_at'] for entry in self.records.values()), default=None)
+        }